@@ -46,16 +46,19 @@ class Game {
             }
             if (EDITOR_MAP_DATA.terrainWidth) this.worldMap.width = w;
             if (EDITOR_MAP_DATA.terrainHeight) this.worldMap.height = h;
-            // Re-run auto-tiler on editor terrain for smooth transitions
-            const autoTiler = new AutoTiler();
-            const tiledLayer = autoTiler.autoTileLayer(this.worldMap.terrainMap, w, h);
+            // Use the offline-baked layer (tools/bake_autotiles.py) when it matches,
+            // otherwise re-run auto-tiler on editor terrain for smooth transitions
+            const bakedLayer = BakedTileLayers.groundLayer(this.worldMap.terrainMap, w, h);
+            const tiledLayer = bakedLayer || new AutoTiler().autoTileLayer(this.worldMap.terrainMap, w, h);
             this.worldMap.groundLayer = this.worldMap.createEmptyLayer();
             for (let row = 0; row < h; row++) {
                 for (let col = 0; col < w; col++) {
                     this.worldMap.setTile(this.worldMap.groundLayer, col, row, tiledLayer[row][col]);
                 }
             }
-            console.log('✅ Re-auto-tiled editor terrain for smooth transitions');
+            console.log(bakedLayer
+                ? '✅ Loaded baked ground tiles for editor terrain'
+                : '✅ Re-auto-tiled editor terrain for smooth transitions');
         }
         this.outdoorMap = this.worldMap;
 
@@ -4530,7 +4533,7 @@ class Game {
         const reloadImage = ({ key, path, fallback, optional }) => new Promise((resolve) => {
             const img = new Image();
             img.onload = () => {
-                this.assetLoader.setImage(key, img);
+                this.assetLoader.setImage(key, img, path);
                 resolve(true);
             };
             img.onerror = () => {
@@ -4538,7 +4541,7 @@ class Game {
                 if (fallback) {
                     const fallbackImg = new Image();
                     fallbackImg.onload = () => {
-                        this.assetLoader.setImage(key, fallbackImg);
+                        this.assetLoader.setImage(key, fallbackImg, fallback);
                         resolve(true);
                     };
                     fallbackImg.onerror = () => {
@@ -4634,6 +4637,16 @@ class Game {
             .onComplete(() => {
                 const hasRealSprites = this.assetLoader.hasImage('character_south');
 
+                // Local dev: pick up sprites rebuilt by the tools/ --watch processors
+                if (CONFIG.LIVE_RELOAD) {
+                    this.assetLoader.enableLiveReload((keys) => {
+                        // One rebuild per batch, however many frames changed
+                        if (keys.some((key) => key.startsWith('character_') || key.startsWith('accessory_'))) {
+                            this.createCombinedSpriteSheet(this.characterConfig);
+                        }
+                    });
+                }
+
                 // Check if there's a saved character to load the correct species
                 const savedData = this.customizationData.load();
                 const species = savedData?.config?.species || 'lobster';
@@ -4918,59 +4931,22 @@ class Game {
             ctx.imageSmoothingEnabled = false;
 
             const directions = ['south', 'north', 'west', 'east'];
-            const composer = customConfig ? new SpriteComposer() : null;
-            const drawAccessories = (ctx, dx, dy, direction) => {
-                if (!customConfig || accessoryIds.length === 0) return;
-                accessoryIds.forEach((accessoryId) => {
-                    const sprites = accessorySprites.get(accessoryId);
-                    if (!sprites) return;
-                    const accessoryImage = sprites[direction];
-                    if (!accessoryImage) return;
-                    ctx.drawImage(accessoryImage, dx, dy, frameWidth, frameHeight);
-                });
-            };
-            const getAlphaBounds = (image) => {
-                const temp = document.createElement('canvas');
-                temp.width = image.width;
-                temp.height = image.height;
-                const tctx = temp.getContext('2d');
-                tctx.imageSmoothingEnabled = false;
-                tctx.clearRect(0, 0, temp.width, temp.height);
-                tctx.drawImage(image, 0, 0);
-                const data = tctx.getImageData(0, 0, temp.width, temp.height).data;
-
-                let top = null;
-                let bottom = null;
-                for (let y = 0; y < temp.height; y++) {
-                    for (let x = 0; x < temp.width; x++) {
-                        const a = data[(y * temp.width + x) * 4 + 3];
-                        if (a > 0) {
-                            if (top === null) top = y;
-                            bottom = y;
-                        }
-                    }
-                }
-
-                if (top === null) {
-                    return { top: 0, bottom: temp.height - 1 };
-                }
-
-                return { top, bottom };
-            };
+            const composer = new SpriteComposer();
+            const accessoryImages = (direction) => accessoryIds
+                .map((accessoryId) => accessorySprites.get(accessoryId))
+                .filter((sprites) => sprites && sprites[direction])
+                .map((sprites) => sprites[direction]);
 
             directions.forEach((dir, dirIndex) => {
                 for (let frame = 0; frame < 3; frame++) {
                     const raw = this.assetLoader.getImage(`character_${dir}_walk_${frame}`);
                     let img = normalizeImage(raw, frameWidth, frameHeight, `${dir} walk frame ${frame}`);
                     if (!img) continue;
-                    if (composer && customConfig) {
+                    if (customConfig) {
                         img = composer.applyColorTint(img, customConfig);
                     }
                     const dx = (dirIndex * 3 + frame) * frameWidth;
-                    const bounds = getAlphaBounds(img);
-                    const dy = (frameHeight - 1) - bounds.bottom;
-                    ctx.drawImage(img, dx, dy, frameWidth, frameHeight);
-                    drawAccessories(ctx, dx, dy, dir);
+                    composer.drawWalkFrame(ctx, img, dx, frameWidth, frameHeight, accessoryImages(dir));
                 }
             });
 
@@ -5738,6 +5714,17 @@ class Game {
             return;
         }
 
+        // Offline-baked layer (tools/bake_autotiles.py) if these are the positions it was baked from
+        const bakedLayer = BakedTileLayers.pathLayer(
+            { path: lightPathPositions, dark_path: darkPathPositions },
+            tilesWide, tilesHigh, this.tileRenderer.tilesets
+        );
+        if (bakedLayer) {
+            this.worldMap.pathLayer = bakedLayer;
+            console.log(`Loaded baked path tile layers: ${totalPaths} total path positions`);
+            return;
+        }
+
         const pathAutoTiler = new PathAutoTiler();
 
         // Combined set of ALL path positions — used for corner computation so that
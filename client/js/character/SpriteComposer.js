@@ -69,6 +69,62 @@ class SpriteComposer {
         return canvas;
     }
 
+    /**
+     * Draw one walk frame into its cell, shifted down so its lowest visible
+     * row sits on the cell's bottom edge, with accessories stretched over
+     * the cell from the same origin
+     * @param {CanvasRenderingContext2D} ctx - Walk sheet context
+     * @param {HTMLImageElement|HTMLCanvasElement} image - Walk frame (already tinted)
+     * @param {number} dx - Cell x on the sheet
+     * @param {number} frameWidth - Cell width
+     * @param {number} frameHeight - Cell height
+     * @param {Array} accessoryImages - Overlays drawn on top, in order
+     * @returns {number} Vertical offset the frame was drawn at
+     */
+    drawWalkFrame(ctx, image, dx, frameWidth, frameHeight, accessoryImages = []) {
+        const bounds = this.getAlphaBounds(image);
+        const dy = (frameHeight - 1) - bounds.bottom;
+        ctx.drawImage(image, dx, dy, frameWidth, frameHeight);
+        for (const accessoryImage of accessoryImages) {
+            ctx.drawImage(accessoryImage, dx, dy, frameWidth, frameHeight);
+        }
+        return dy;
+    }
+
+    /**
+     * First and last rows with any alpha (whole image if fully transparent)
+     * @param {HTMLImageElement|HTMLCanvasElement} image - Source image
+     * @returns {{top: number, bottom: number}}
+     */
+    getAlphaBounds(image) {
+        const temp = document.createElement('canvas');
+        temp.width = image.width;
+        temp.height = image.height;
+        const tctx = temp.getContext('2d');
+        tctx.imageSmoothingEnabled = false;
+        tctx.clearRect(0, 0, temp.width, temp.height);
+        tctx.drawImage(image, 0, 0);
+        const data = tctx.getImageData(0, 0, temp.width, temp.height).data;
+
+        let top = null;
+        let bottom = null;
+        for (let y = 0; y < temp.height; y++) {
+            for (let x = 0; x < temp.width; x++) {
+                const a = data[(y * temp.width + x) * 4 + 3];
+                if (a > 0) {
+                    if (top === null) top = y;
+                    bottom = y;
+                }
+            }
+        }
+
+        if (top === null) {
+            return { top: 0, bottom: temp.height - 1 };
+        }
+
+        return { top, bottom };
+    }
+
     /**
      * Apply hue shift to red pixels only
      * @param {HTMLImageElement|HTMLCanvasElement} image - Source image
@@ -223,3 +279,7 @@ class SpriteComposer {
         });
     }
 }
+
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = SpriteComposer;
+}
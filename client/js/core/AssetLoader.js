@@ -2,6 +2,7 @@
 class AssetLoader {
     constructor() {
         this.images = new Map();
+        this.paths = new Map(); // key -> source path, for live reload
         this.loadQueue = [];
         this.loadedCount = 0;
         this.totalCount = 0;
@@ -63,6 +64,7 @@ class AssetLoader {
 
             img.onload = () => {
                 this.images.set(key, img);
+                this.paths.set(key, path);
                 this.loadedCount++;
 
                 if (this.onProgressCallback) {
@@ -102,9 +104,50 @@ class AssetLoader {
         return this.images.has(key);
     }
 
-    // Store a generated image (e.g. combined sheet)
-    setImage(key, image) {
+    // Store a generated image (e.g. combined sheet); pass path to keep it live-reloadable
+    setImage(key, image, path = null) {
         this.images.set(key, image);
+        if (path) {
+            this.paths.set(key, path);
+        } else {
+            this.paths.delete(key);
+        }
+    }
+
+    // Subscribe to serve.py's live-reload stream and hot-swap changed images in place.
+    // Swapping the src of the existing Image keeps every reference to it valid;
+    // onReload(keys) fires once per event, after every changed image has decoded,
+    // so a species rebuild touching dozens of sprites costs one callback.
+    enableLiveReload(onReload = null, url = '/__livereload') {
+        if (typeof EventSource === 'undefined' || this.liveReloadSource) return;
+
+        this.liveReloadSource = new EventSource(url);
+        this.liveReloadSource.onmessage = (event) => {
+            const changed = new Set(JSON.parse(event.data).paths);
+            const reloads = [];
+            for (const [key, path] of this.paths) {
+                const img = this.images.get(key);
+                if (!changed.has(path) || !(img instanceof HTMLImageElement)) continue;
+
+                reloads.push(new Promise((resolve) => {
+                    img.onload = () => {
+                        console.log(`🔁 Reloaded ${key}`);
+                        resolve(key);
+                    };
+                    img.onerror = () => {
+                        console.warn(`Live reload failed for ${path}`);
+                        resolve(null);
+                    };
+                    img.src = `${path}?v=${Date.now()}`;
+                }));
+            }
+            if (reloads.length === 0) return;
+
+            Promise.all(reloads).then((keys) => {
+                const reloaded = keys.filter(Boolean);
+                if (onReload && reloaded.length > 0) onReload(reloaded);
+            });
+        };
     }
 
     // Get loading progress (0-1)
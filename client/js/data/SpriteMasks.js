@@ -0,0 +1,222 @@
+// Generated by tools/bake_sprite_masks.py from decoration/building art — do not edit.
+const SPRITE_MASKS = {
+  "alphaThreshold": 64,
+  "maskCell": 8,
+  "sprites": {
+    "decorations/anchor": {"size":[12,20],"bounds":[2,1,10,19],"footprint":[10,18,2,2]},
+    "decorations/beach_1": {"size":[20,17],"bounds":[1,0,19,16],"footprint":[2,12,16,4]},
+    "decorations/beach_10": {"size":[20,20],"bounds":[1,0,19,20],"footprint":[2,15,17,5],"mask":"CAA="},
+    "decorations/beach_11": {"size":[19,20],"bounds":[0,1,19,19],"footprint":[1,15,17,5],"mask":"CAA="},
+    "decorations/beach_12": {"size":[20,20],"bounds":[0,1,20,19],"footprint":[2,15,18,5]},
+    "decorations/beach_13": {"size":[20,14],"bounds":[0,0,20,14],"footprint":[1,10,18,4]},
+    "decorations/beach_14": {"size":[18,20],"bounds":[0,0,18,20],"footprint":[2,15,15,5],"mask":"CAA="},
+    "decorations/beach_15": {"size":[20,20],"bounds":[0,0,20,20],"footprint":[2,15,17,5],"mask":"CAA="},
+    "decorations/beach_16": {"size":[20,19],"bounds":[0,0,20,19],"footprint":[1,14,19,5],"mask":"CAA="},
+    "decorations/beach_17": {"size":[20,15],"bounds":[0,0,20,15],"footprint":[0,11,19,4]},
+    "decorations/beach_18": {"size":[20,20],"bounds":[0,1,20,19],"footprint":[3,15,14,5]},
+    "decorations/beach_19": {"size":[20,13],"bounds":[0,1,20,12],"footprint":[2,10,16,3]},
+    "decorations/beach_2": {"size":[20,19],"bounds":[0,0,20,19],"footprint":[1,14,19,5],"mask":"CAA="},
+    "decorations/beach_20": {"size":[20,18],"bounds":[0,0,20,18],"footprint":[2,14,16,4],"mask":"CAA="},
+    "decorations/beach_21": {"size":[20,19],"bounds":[0,0,20,19],"footprint":[1,14,18,5],"mask":"CAA="},
+    "decorations/beach_22": {"size":[20,19],"bounds":[0,0,19,19],"footprint":[0,14,19,5],"mask":"CAA="},
+    "decorations/beach_23": {"size":[20,11],"bounds":[0,1,20,10],"footprint":[1,9,17,2]},
+    "decorations/beach_24": {"size":[20,17],"bounds":[1,1,19,16],"footprint":[4,13,12,4]},
+    "decorations/beach_25": {"size":[20,13],"bounds":[0,0,20,13],"footprint":[2,10,16,3]},
+    "decorations/beach_26": {"size":[20,16],"bounds":[0,0,20,16],"footprint":[1,12,17,4]},
+    "decorations/beach_27": {"size":[20,15],"bounds":[1,0,19,15],"footprint":[2,11,17,4]},
+    "decorations/beach_28": {"size":[20,17],"bounds":[0,0,20,17],"footprint":[2,13,17,4]},
+    "decorations/beach_29": {"size":[20,14],"bounds":[1,0,19,14],"footprint":[1,10,19,4]},
+    "decorations/beach_3": {"size":[17,20],"bounds":[1,0,16,20],"footprint":[1,15,15,5],"mask":"CAA="},
+    "decorations/beach_30": {"size":[20,17],"bounds":[0,0,20,17],"footprint":[0,13,20,4]},
+    "decorations/beach_31": {"size":[20,12],"bounds":[0,1,20,11],"footprint":[1,9,17,3]},
+    "decorations/beach_32": {"size":[14,20],"bounds":[0,0,14,20],"footprint":[0,15,10,5]},
+    "decorations/beach_33": {"size":[20,16],"bounds":[0,1,20,15],"footprint":[2,12,16,4]},
+    "decorations/beach_34": {"size":[20,17],"bounds":[0,1,20,16],"footprint":[0,13,10,4]},
+    "decorations/beach_35": {"size":[20,14],"bounds":[1,1,19,13],"footprint":[2,11,15,3]},
+    "decorations/beach_36": {"size":[20,18],"bounds":[1,0,19,18],"footprint":[1,14,11,4]},
+    "decorations/beach_37": {"size":[20,18],"bounds":[1,0,18,17],"footprint":[2,13,15,4]},
+    "decorations/beach_38": {"size":[20,20],"bounds":[1,2,19,18],"footprint":[4,16,13,4],"mask":"CAA="},
+    "decorations/beach_39": {"size":[20,6],"bounds":[0,1,20,4],"footprint":[0,3,19,2]},
+    "decorations/beach_4": {"size":[19,20],"bounds":[0,0,19,20],"footprint":[1,15,17,5],"mask":"CAA="},
+    "decorations/beach_40": {"size":[20,16],"bounds":[1,1,19,15],"footprint":[3,12,11,4]},
+    "decorations/beach_41": {"size":[20,18],"bounds":[0,0,20,18],"footprint":[2,14,16,4]},
+    "decorations/beach_42": {"size":[20,19],"bounds":[0,1,20,18],"footprint":[2,15,17,4]},
+    "decorations/beach_43": {"size":[17,20],"bounds":[0,1,17,19],"footprint":[5,15,8,5]},
+    "decorations/beach_44": {"size":[20,19],"bounds":[1,0,19,19],"footprint":[2,14,17,5]},
+    "decorations/beach_45": {"size":[17,20],"bounds":[1,1,16,19],"footprint":[5,15,7,5]},
+    "decorations/beach_46": {"size":[17,20],"bounds":[0,1,17,19],"footprint":[4,15,10,5]},
+    "decorations/beach_47": {"size":[20,8],"bounds":[0,1,20,7],"footprint":[0,6,20,2]},
+    "decorations/beach_48": {"size":[19,20],"bounds":[0,1,19,19],"footprint":[2,15,14,5]},
+    "decorations/beach_49": {"size":[20,19],"bounds":[1,1,18,17],"footprint":[1,14,15,4]},
+    "decorations/beach_5": {"size":[20,14],"bounds":[0,1,20,13],"footprint":[4,11,12,3]},
+    "decorations/beach_50": {"size":[20,18],"bounds":[0,0,20,18],"footprint":[2,14,16,4],"mask":"CAA="},
+    "decorations/beach_51": {"size":[20,19],"bounds":[1,0,18,19],"footprint":[3,14,14,5]},
+    "decorations/beach_52": {"size":[20,18],"bounds":[0,1,20,16],"footprint":[1,13,18,4],"mask":"CAA="},
+    "decorations/beach_6": {"size":[20,17],"bounds":[0,0,20,17],"footprint":[4,13,13,4]},
+    "decorations/beach_7": {"size":[20,14],"bounds":[0,0,20,14],"footprint":[1,10,19,4]},
+    "decorations/beach_8": {"size":[20,13],"bounds":[1,0,19,13],"footprint":[3,10,15,3]},
+    "decorations/beach_9": {"size":[17,20],"bounds":[0,0,17,20],"footprint":[2,15,14,5]},
+    "decorations/brick_path": {"size":[16,16],"bounds":[0,0,16,16],"footprint":[0,12,16,4],"mask":"8A=="},
+    "decorations/bridge_wood_h": {"size":[32,16],"bounds":[0,0,32,16],"footprint":[0,12,32,4]},
+    "decorations/bridge_wood_v": {"size":[16,32],"bounds":[0,0,16,32],"footprint":[0,24,16,8]},
+    "decorations/buoy": {"size":[16,20],"bounds":[0,0,16,20],"footprint":[0,15,16,5],"mask":"8A=="},
+    "decorations/bushes_raw": {"size":[1024,1024],"bounds":[0,0,1024,1024],"footprint":[0,768,1024,256],"mask":"//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8="},
+    "decorations/campfire": {"size":[16,18],"bounds":[0,0,16,18],"footprint":[0,14,12,4]},
+    "decorations/campfire2": {"size":[18,20],"bounds":[0,0,18,20],"footprint":[0,15,18,5],"mask":"2AA="},
+    "decorations/chronicle_stone": {"size":[16,20],"bounds":[2,1,13,18],"footprint":[2,15,13,4]},
+    "decorations/cobblestone_path": {"size":[16,16],"bounds":[0,0,16,16],"footprint":[0,12,16,4],"mask":"8A=="},
+    "decorations/coral": {"size":[12,14],"bounds":[0,0,12,14],"footprint":[0,10,12,4]},
+    "decorations/coral_pink": {"size":[12,14],"bounds":[0,0,12,14],"footprint":[0,10,11,4]},
+    "decorations/decor_1": {"size":[27,28],"bounds":[0,1,27,27],"footprint":[0,21,27,7],"mask":"BkA="},
+    "decorations/decor_10": {"size":[21,28],"bounds":[1,0,20,28],"footprint":[1,21,19,7],"mask":"AQA="},
+    "decorations/decor_11": {"size":[16,22],"bounds":[2,3,5,7],"footprint":[2,8,5,2]},
+    "decorations/decor_12": {"size":[28,23],"bounds":[0,1,28,22],"footprint":[0,17,28,6],"mask":"AgA="},
+    "decorations/decor_13": {"size":[20,23],"bounds":[2,2,16,19],"footprint":[6,16,10,5]},
+    "decorations/decor_14": {"size":[20,28],"bounds":[0,0,20,28],"footprint":[0,21,20,7],"mask":"AQA="},
+    "decorations/decor_15": {"size":[20,28],"bounds":[0,1,20,27],"footprint":[0,21,20,7],"mask":"AQA="},
+    "decorations/decor_16": {"size":[26,28],"bounds":[0,0,26,28],"footprint":[1,21,25,7]},
+    "decorations/decor_17": {"size":[28,26],"bounds":[1,0,27,26],"footprint":[1,20,27,6],"mask":"BAA="},
+    "decorations/decor_18": {"size":[25,28],"bounds":[0,0,25,28],"footprint":[0,21,25,7]},
+    "decorations/decor_19": {"size":[20,28],"bounds":[0,1,20,27],"footprint":[1,21,19,7],"mask":"CAA="},
+    "decorations/decor_2": {"size":[28,28],"bounds":[0,1,28,27],"footprint":[0,21,28,7],"mask":"BmA="},
+    "decorations/decor_20": {"size":[16,28],"bounds":[0,1,16,27],"footprint":[0,21,16,7]},
+    "decorations/decor_21": {"size":[19,28],"bounds":[0,0,19,27],"footprint":[0,20,19,7]},
+    "decorations/decor_22": {"size":[19,28],"bounds":[0,1,19,27],"footprint":[1,21,18,7]},
+    "decorations/decor_23": {"size":[13,28],"bounds":[1,0,12,28],"footprint":[3,21,6,7]},
+    "decorations/decor_24": {"size":[23,28],"bounds":[0,0,23,28],"footprint":[0,21,23,7],"mask":"CQA="},
+    "decorations/decor_3": {"size":[28,14],"bounds":[23,5,5,9],"footprint":[23,12,5,2]},
+    "decorations/decor_4": {"size":[17,28],"bounds":[0,0,17,28],"footprint":[4,21,10,7]},
+    "decorations/decor_5": {"size":[28,28],"bounds":[0,1,28,27],"footprint":[2,21,24,7],"mask":"BgA="},
+    "decorations/decor_6": {"size":[18,28],"bounds":[1,1,17,27],"footprint":[1,21,17,7]},
+    "decorations/decor_7": {"size":[28,28],"bounds":[0,0,28,28],"footprint":[0,21,28,7],"mask":"AEA="},
+    "decorations/decor_8": {"size":[21,28],"bounds":[1,0,20,28],"footprint":[1,21,19,7]},
+    "decorations/decor_9": {"size":[25,28],"bounds":[0,1,25,27],"footprint":[1,21,23,7],"mask":"BkA="},
+    "decorations/dirt_path": {"size":[16,16],"bounds":[0,0,16,16],"footprint":[0,12,16,4],"mask":"8A=="},
+    "decorations/dirt_path_brick_backup": {"size":[16,16],"bounds":[0,0,16,16],"footprint":[0,12,16,4],"mask":"8A=="},
+    "decorations/driftwood": {"size":[16,8],"bounds":[1,0,15,8],"footprint":[1,6,15,2]},
+    "decorations/driftwood2": {"size":[14,6],"bounds":[0,0,14,6],"footprint":[0,4,14,2]},
+    "decorations/fern": {"size":[18,16],"bounds":[0,0,18,16],"footprint":[11,12,7,4]},
+    "decorations/fern2": {"size":[18,16],"bounds":[0,0,18,16],"footprint":[0,12,18,4],"mask":"2A=="},
+    "decorations/fishing_boat": {"size":[22,18],"bounds":[0,0,22,18],"footprint":[0,14,22,4],"mask":"2AA="},
+    "decorations/fishing_net": {"size":[20,20],"bounds":[0,0,20,20],"footprint":[0,15,10,5]},
+    "decorations/flower_stem": {"size":[16,24],"bounds":[0,0,16,24],"footprint":[0,18,16,6],"mask":"/A=="},
+    "decorations/grass_tall": {"size":[18,22],"bounds":[0,0,18,22],"footprint":[0,16,18,6],"mask":"2AA="},
+    "decorations/lobster_statue": {"size":[20,24],"bounds":[0,0,20,24],"footprint":[0,18,20,6]},
+    "decorations/lobster_statue2": {"size":[20,24],"bounds":[0,0,20,24],"footprint":[0,18,20,6],"mask":"2wA="},
+    "decorations/message_bottle": {"size":[12,16],"bounds":[0,0,12,16],"footprint":[0,12,12,4]},
+    "decorations/ocean_decor_sheet": {"size":[1024,1024],"bounds":[0,0,1024,1024],"footprint":[0,768,1024,256],"mask":"//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8="},
+    "decorations/palm_tree": {"size":[24,48],"bounds":[0,0,24,48],"footprint":[0,36,24,12],"mask":"AAgA"},
+    "decorations/palm_tree2": {"size":[24,48],"bounds":[0,0,24,48],"footprint":[0,36,24,12],"mask":"///A"},
+    "decorations/palm_tree3": {"size":[24,48],"bounds":[0,0,24,48],"footprint":[0,36,24,12],"mask":"///A"},
+    "decorations/palm_tree_1": {"size":[36,48],"bounds":[0,0,36,48],"footprint":[9,36,14,12],"mask":"ABgAAA=="},
+    "decorations/palm_tree_2": {"size":[33,48],"bounds":[0,1,33,47],"footprint":[12,36,9,12]},
+    "decorations/palm_tree_raw": {"size":[1024,1024],"bounds":[0,0,1024,1024],"footprint":[0,768,1024,256],"mask":"//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8="},
+    "decorations/path_raw": {"size":[1024,1024],"bounds":[0,0,1024,1024],"footprint":[0,768,1024,256],"mask":"//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8="},
+    "decorations/plant_1": {"size":[15,24],"bounds":[0,1,15,22],"footprint":[0,17,15,6]},
+    "decorations/plant_10": {"size":[24,21],"bounds":[1,1,23,20],"footprint":[7,16,16,5]},
+    "decorations/plant_11": {"size":[24,24],"bounds":[0,0,24,24],"footprint":[2,18,19,6]},
+    "decorations/plant_12": {"size":[24,21],"bounds":[0,0,24,21],"footprint":[4,16,18,5]},
+    "decorations/plant_13": {"size":[24,21],"bounds":[0,0,24,21],"footprint":[4,16,18,5],"mask":"CAA="},
+    "decorations/plant_14": {"size":[24,20],"bounds":[1,0,22,19],"footprint":[4,14,17,5],"mask":"CAA="},
+    "decorations/plant_15": {"size":[14,24],"bounds":[1,0,13,24],"footprint":[3,18,9,6]},
+    "decorations/plant_16": {"size":[15,24],"bounds":[1,0,14,24],"footprint":[3,18,10,6]},
+    "decorations/plant_17": {"size":[9,24],"bounds":[2,3,5,16],"footprint":[3,15,1,4]},
+    "decorations/plant_18": {"size":[24,23],"bounds":[1,0,23,23],"footprint":[3,17,19,6]},
+    "decorations/plant_19": {"size":[14,24],"bounds":[1,0,13,24],"footprint":[3,18,9,6]},
+    "decorations/plant_2": {"size":[24,23],"bounds":[1,0,23,23],"footprint":[3,17,19,6],"mask":"CAA="},
+    "decorations/plant_3": {"size":[22,24],"bounds":[0,0,21,24],"footprint":[1,18,17,6]},
+    "decorations/plant_4": {"size":[24,19],"bounds":[0,1,24,18],"footprint":[9,15,8,4]},
+    "decorations/plant_5": {"size":[24,24],"bounds":[0,1,24,23],"footprint":[1,18,19,6],"mask":"CAA="},
+    "decorations/plant_6": {"size":[24,23],"bounds":[0,1,24,22],"footprint":[4,17,16,6]},
+    "decorations/plant_7": {"size":[24,22],"bounds":[0,0,23,22],"footprint":[2,16,21,6],"mask":"CAA="},
+    "decorations/plant_8": {"size":[24,21],"bounds":[0,0,24,21],"footprint":[6,16,18,5],"mask":"CAA="},
+    "decorations/plant_9": {"size":[20,24],"bounds":[0,0,20,24],"footprint":[4,18,13,6]},
+    "decorations/potion_blue": {"size":[14,18],"bounds":[0,0,14,18],"footprint":[0,14,14,4],"mask":"oA=="},
+    "decorations/potion_blue2": {"size":[12,18],"bounds":[0,0,12,18],"footprint":[0,14,12,4],"mask":"oA=="},
+    "decorations/rock_gray": {"size":[16,12],"bounds":[2,4,14,8],"footprint":[12,10,4,2]},
+    "decorations/rock_gray2": {"size":[14,10],"bounds":[0,0,14,10],"footprint":[0,8,14,2],"mask":"gA=="},
+    "decorations/rock_smooth": {"size":[16,12],"bounds":[0,0,16,12],"footprint":[0,9,16,3],"mask":"wA=="},
+    "decorations/rocks_raw": {"size":[1024,1024],"bounds":[0,0,1024,1024],"footprint":[0,768,1024,256],"mask":"//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8="},
+    "decorations/scroll": {"size":[12,16],"bounds":[0,0,12,16],"footprint":[0,12,12,4],"mask":"oA=="},
+    "decorations/seagrass": {"size":[18,12],"bounds":[0,0,14,12],"footprint":[0,9,14,3]},
+    "decorations/seagrass_tall": {"size":[20,22],"bounds":[0,0,20,22],"footprint":[0,16,20,6]},
+    "decorations/shell_peach": {"size":[16,12],"bounds":[0,0,16,12],"footprint":[0,9,16,3],"mask":"wA=="},
+    "decorations/shell_pink": {"size":[14,12],"bounds":[0,0,14,12],"footprint":[0,9,14,3]},
+    "decorations/shell_red": {"size":[16,12],"bounds":[0,0,16,12],"footprint":[0,9,16,3],"mask":"wA=="},
+    "decorations/shell_spiral": {"size":[12,12],"bounds":[5,0,7,12],"footprint":[5,9,7,3]},
+    "decorations/shell_spiral2": {"size":[10,10],"bounds":[0,0,10,10],"footprint":[0,8,10,2],"mask":"gA=="},
+    "decorations/shell_striped": {"size":[12,10],"bounds":[0,0,12,10],"footprint":[0,8,12,2],"mask":"gA=="},
+    "decorations/shell_white": {"size":[14,12],"bounds":[2,0,12,8],"footprint":[7,6,7,2]},
+    "decorations/starfish": {"size":[14,14],"bounds":[0,0,14,14],"footprint":[0,10,14,4]},
+    "decorations/starfish_orange": {"size":[14,14],"bounds":[0,0,14,14],"footprint":[9,10,5,4]},
+    "decorations/starfish_pink": {"size":[14,14],"bounds":[0,0,14,14],"footprint":[0,10,14,4],"mask":"gA=="},
+    "decorations/treasure_chest": {"size":[22,18],"bounds":[0,7,22,11],"footprint":[2,15,20,3]},
+    "decorations/treasure_chest2": {"size":[22,18],"bounds":[0,0,22,18],"footprint":[0,14,22,4],"mask":"2AA="},
+    "decorations/treasure_chest_gold": {"size":[18,16],"bounds":[0,0,18,16],"footprint":[0,12,18,4],"mask":"2A=="},
+    "decorations/tropical_plant": {"size":[22,24],"bounds":[0,0,22,24],"footprint":[0,18,22,6],"mask":"2wA="},
+    "decorations/wood_raw": {"size":[1024,1024],"bounds":[0,0,1024,1024],"footprint":[0,768,1024,256],"mask":"//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8="},
+    "decorations/wooden_sign": {"size":[20,14],"bounds":[0,0,20,14],"footprint":[0,10,20,4]},
+    "buildings/bakery_base": {"size":[64,64],"bounds":[0,0,64,64],"footprint":[0,26,64,38],"mask":"AAwMAABhPAA="},
+    "buildings/boathouse_base": {"size":[64,64],"bounds":[2,9,60,47],"footprint":[2,28,60,28],"mask":"AAAMFAhQAAA="},
+    "buildings/fishingshack_base": {"size":[64,64],"bounds":[4,3,56,57],"footprint":[4,26,56,34]},
+    "buildings/house_base": {"size":[48,48],"bounds":[1,3,44,40],"footprint":[7,19,38,24]},
+    "buildings/inn_base": {"size":[96,72],"bounds":[6,0,90,72],"footprint":[6,29,90,43],"mask":"AAAAAMAgB4AUAcAAIKA="},
+    "buildings/lighthouse_base": {"size":[48,96],"bounds":[0,0,48,96],"footprint":[3,38,42,58],"mask":"AAMMMMMMMMeA"},
+    "buildings/shop_base": {"size":[72,55],"bounds":[6,0,63,55],"footprint":[6,22,63,33],"mask":"AAYHB8Hx8AA="},
+    "buildings/tavern_base": {"size":[64,64],"bounds":[0,8,62,51],"footprint":[0,28,62,31],"mask":"AAAIAAgADAA="},
+    "buildings/tikihut_base": {"size":[64,64],"bounds":[2,3,62,59],"footprint":[7,27,57,35],"mask":"AAAAAAgAMAA="}
+  },
+  "types": {
+    "palm": {"sprite":"decorations/palm_tree_1","collision":{"width":14,"height":12,"offsetX":9,"offsetY":36}},
+    "palm2": {"sprite":"decorations/palm_tree_2","collision":{"width":9,"height":12,"offsetX":12,"offsetY":36}},
+    "bush": {"sprite":"decorations/plant_2","collision":{"width":19,"height":6,"offsetX":3,"offsetY":17}},
+    "bush_flower": {"sprite":"decorations/plant_11","collision":{"width":19,"height":6,"offsetX":2,"offsetY":18}},
+    "bush_flower2": {"sprite":"decorations/plant_12","collision":{"width":18,"height":5,"offsetX":4,"offsetY":16}},
+    "fern": {"sprite":"decorations/plant_4","footprint":{"width":8,"height":4,"offsetX":9,"offsetY":15}},
+    "fern2": {"sprite":"decorations/plant_7","footprint":{"width":21,"height":6,"offsetX":2,"offsetY":16}},
+    "seagrass": {"sprite":"decorations/plant_16","footprint":{"width":10,"height":6,"offsetX":3,"offsetY":18}},
+    "seagrass_tall": {"sprite":"decorations/plant_18","footprint":{"width":19,"height":6,"offsetX":3,"offsetY":17}},
+    "tropical_plant": {"sprite":"decorations/plant_6","footprint":{"width":16,"height":6,"offsetX":4,"offsetY":17}},
+    "flower_stem": {"sprite":"decorations/plant_15","footprint":{"width":9,"height":6,"offsetX":3,"offsetY":18}},
+    "small_plant": {"sprite":"decorations/plant_17","footprint":{"width":1,"height":4,"offsetX":3,"offsetY":15}},
+    "tree_bush": {"sprite":"decorations/plant_6","collision":{"width":16,"height":6,"offsetX":4,"offsetY":17}},
+    "shell_pink": {"sprite":"decorations/beach_1","footprint":{"width":16,"height":4,"offsetX":2,"offsetY":12}},
+    "shell_fan": {"sprite":"decorations/beach_6","footprint":{"width":13,"height":4,"offsetX":4,"offsetY":13}},
+    "shell_spiral": {"sprite":"decorations/beach_32","footprint":{"width":10,"height":5,"offsetX":0,"offsetY":15}},
+    "shell_white": {"sprite":"decorations/beach_17","footprint":{"width":19,"height":4,"offsetX":0,"offsetY":11}},
+    "shell_striped": {"sprite":"decorations/beach_24","footprint":{"width":12,"height":4,"offsetX":4,"offsetY":13}},
+    "rock": {"sprite":"decorations/beach_10","collision":{"width":17,"height":5,"offsetX":2,"offsetY":15}},
+    "rock2": {"sprite":"decorations/beach_12","collision":{"width":18,"height":5,"offsetX":2,"offsetY":15}},
+    "rock_small": {"sprite":"decorations/beach_19","footprint":{"width":16,"height":3,"offsetX":2,"offsetY":10}},
+    "starfish": {"sprite":"decorations/beach_43","footprint":{"width":8,"height":5,"offsetX":5,"offsetY":15}},
+    "starfish2": {"sprite":"decorations/beach_45","footprint":{"width":7,"height":5,"offsetX":5,"offsetY":15}},
+    "starfish3": {"sprite":"decorations/beach_46","footprint":{"width":10,"height":5,"offsetX":4,"offsetY":15}},
+    "coral": {"sprite":"decorations/beach_50","footprint":{"width":16,"height":4,"offsetX":2,"offsetY":14}},
+    "coral2": {"sprite":"decorations/beach_51","footprint":{"width":14,"height":5,"offsetX":3,"offsetY":14}},
+    "coral3": {"sprite":"decorations/beach_52","footprint":{"width":18,"height":4,"offsetX":1,"offsetY":13}},
+    "driftwood": {"sprite":"decorations/beach_33","footprint":{"width":16,"height":4,"offsetX":2,"offsetY":12}},
+    "driftwood2": {"sprite":"decorations/beach_40","footprint":{"width":11,"height":4,"offsetX":3,"offsetY":12}},
+    "treasure_chest": {"sprite":"decorations/decor_1","collision":{"width":27,"height":7,"offsetX":0,"offsetY":21}},
+    "treasure_chest2": {"sprite":"decorations/decor_2","collision":{"width":28,"height":7,"offsetX":0,"offsetY":21}},
+    "lobster_statue": {"sprite":"decorations/decor_4","collision":{"width":10,"height":7,"offsetX":4,"offsetY":21}},
+    "wooden_sign": {"sprite":"decorations/decor_5","collision":{"width":24,"height":7,"offsetX":2,"offsetY":21}},
+    "anchor": {"sprite":"decorations/decor_8","collision":{"width":19,"height":7,"offsetX":1,"offsetY":21}},
+    "campfire": {"sprite":"decorations/decor_11","collision":{"width":5,"height":2,"offsetX":2,"offsetY":8}},
+    "fishing_net": {"sprite":"decorations/decor_12","footprint":{"width":28,"height":6,"offsetX":0,"offsetY":17}},
+    "fishing_net2": {"sprite":"decorations/decor_16","footprint":{"width":25,"height":7,"offsetX":1,"offsetY":21}},
+    "message_bottle": {"sprite":"decorations/message_bottle","footprint":{"width":4,"height":2,"offsetX":0,"offsetY":4}},
+    "scroll": {"sprite":"decorations/decor_19","footprint":{"width":5,"height":2,"offsetX":0,"offsetY":5}},
+    "buoy": {"sprite":"decorations/decor_24","collision":{"width":12,"height":4,"offsetX":0,"offsetY":10}},
+    "log_pile": {"sprite":"decorations/decor_17","collision":{"width":27,"height":6,"offsetX":1,"offsetY":20}},
+    "dirt_path": {"sprite":"decorations/dirt_path","footprint":{"width":16,"height":4,"offsetX":0,"offsetY":12}},
+    "cobblestone_path": {"sprite":"decorations/cobblestone_path","footprint":{"width":16,"height":4,"offsetX":0,"offsetY":12}},
+    "flower": {"sprite":"decorations/plant_5","footprint":{"width":19,"height":6,"offsetX":1,"offsetY":18}},
+    "grass": {"sprite":"decorations/plant_14","footprint":{"width":17,"height":5,"offsetX":4,"offsetY":14}},
+    "bridge_wood_v": {"sprite":"decorations/bridge_wood_v","footprint":{"width":16,"height":8,"offsetX":0,"offsetY":24}},
+    "bridge_wood_h": {"sprite":"decorations/bridge_wood_h","footprint":{"width":32,"height":4,"offsetX":0,"offsetY":12}}
+  }
+};
+
+if (typeof module !== 'undefined') {
+  module.exports = SPRITE_MASKS;
+}
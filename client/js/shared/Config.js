@@ -29,6 +29,9 @@ const CONFIG = {
     
     // Game settings
     DEBUG_MODE: false,
+
+    // Hot-swap sprites when serve.py reports rebuilt assets (local dev only)
+    LIVE_RELOAD: ['localhost', '127.0.0.1'].includes(window.location.hostname),
     
     // Parse query params to override config
     init() {
@@ -51,6 +54,10 @@ const CONFIG = {
         if (params.get('debug') === 'true') {
             this.DEBUG_MODE = true;
         }
+
+        if (params.get('livereload') === 'false') {
+            this.LIVE_RELOAD = false;
+        }
         
         return this;
     }
@@ -0,0 +1,90 @@
+// BakedTileLayers — autotiled ground/path layers precomputed by tools/bake_autotiles.py
+//
+// BAKED_TILE_DATA (js/data/BakedTileData.js) holds the final tile id of every
+// cell, so boot can skip AutoTiler/PathAutoTiler. Each layer also carries the
+// input it was baked from; if the live map differs (editor changes, procedural
+// paths, stale bake) these return null and the caller autotiles as before.
+//
+// Path cells are encoded as 0 = empty, else tilesetIndex * 16 + tileId + 1.
+
+class BakedTileLayers {
+    static get data() {
+        return typeof BAKED_TILE_DATA !== 'undefined' ? BAKED_TILE_DATA : null;
+    }
+
+    static decode(base64) {
+        const binary = atob(base64);
+        const bytes = new Uint8Array(binary.length);
+        for (let i = 0; i < binary.length; i++) {
+            bytes[i] = binary.charCodeAt(i);
+        }
+        return bytes;
+    }
+
+    static bit(bits, index) {
+        return (bits[index >> 3] >> (7 - (index & 7))) & 1;
+    }
+
+    /**
+     * Baked ground layer for this terrain, or null if it doesn't match.
+     * @param {Array<Array<number>>} terrainMap - 2D array (1 = water)
+     * @returns {Array<Array<number>>|null} Tile ID map (PNG positions)
+     */
+    static groundLayer(terrainMap, tilesWide, tilesHigh) {
+        const data = BakedTileLayers.data;
+        if (!data || data.width !== tilesWide || data.height !== tilesHigh) return null;
+
+        const mask = BakedTileLayers.decode(data.groundMask);
+        for (let row = 0; row < tilesHigh; row++) {
+            for (let col = 0; col < tilesWide; col++) {
+                const isLand = terrainMap[row][col] !== 1 ? 1 : 0;
+                if (BakedTileLayers.bit(mask, row * tilesWide + col) !== isLand) return null;
+            }
+        }
+
+        const ids = BakedTileLayers.decode(data.ground);
+        const layer = [];
+        for (let row = 0; row < tilesHigh; row++) {
+            layer.push(Array.from(ids.subarray(row * tilesWide, (row + 1) * tilesWide)));
+        }
+        return layer;
+    }
+
+    /**
+     * Baked path layer for these path positions, or null if it doesn't match.
+     * @param {Object<string, Set<string>>} positionsByTileset - e.g. { path: Set("col,row"), dark_path: ... }
+     * @param {Map} tilesets - Loaded tilesets (TileRenderer.tilesets)
+     * @returns {Array<Array<object|null>>|null} 2D array of {id, tileset} or null cells
+     */
+    static pathLayer(positionsByTileset, tilesWide, tilesHigh, tilesets) {
+        const data = BakedTileLayers.data;
+        if (!data || data.width !== tilesWide || data.height !== tilesHigh) return null;
+
+        for (const key of data.pathTilesets) {
+            const positions = positionsByTileset[key] || new Set();
+            if (positions.size !== data.pathCounts[key]) return null;
+            if (positions.size > 0 && !tilesets.has(key)) return null;
+
+            const mask = BakedTileLayers.decode(data.pathMasks[key]);
+            for (const pos of positions) {
+                const [col, row] = pos.split(',').map(Number);
+                if (col < 0 || col >= tilesWide || row < 0 || row >= tilesHigh) return null;
+                if (!BakedTileLayers.bit(mask, row * tilesWide + col)) return null;
+            }
+        }
+
+        const cells = BakedTileLayers.decode(data.paths);
+        const layer = [];
+        for (let row = 0; row < tilesHigh; row++) {
+            layer[row] = [];
+            for (let col = 0; col < tilesWide; col++) {
+                const value = cells[row * tilesWide + col];
+                layer[row][col] = value === 0 ? null : {
+                    id: (value - 1) % 16,
+                    tileset: data.pathTilesets[Math.floor((value - 1) / 16)]
+                };
+            }
+        }
+        return layer;
+    }
+}
@@ -6,6 +6,11 @@ import base64
 from PIL import Image
 import io
 import os
+import sys
+
+# Shared atomic writer: a running serve.py never hands out a half-written PNG
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tools'))
+from asset_writer import save_atomic, summary  # noqa: E402
 
 # Create directories
 os.makedirs('client/assets/sprites/tiles', exist_ok=True)
@@ -40,7 +45,7 @@ for i, tile in enumerate(tiles):
 
     tileset_image.paste(tile_img, (x, y))
 
-tileset_image.save('client/assets/sprites/tiles/sand_water.png')
+save_atomic(tileset_image, 'client/assets/sprites/tiles/sand_water.png')
 print("✅ Saved sand_water.png")
 
 # Extract grass/dirt tileset
@@ -64,7 +69,7 @@ for i, tile in enumerate(tiles):
 
     tileset_image.paste(tile_img, (x, y))
 
-tileset_image.save('client/assets/sprites/tiles/grass_dirt.png')
+save_atomic(tileset_image, 'client/assets/sprites/tiles/grass_dirt.png')
 print("✅ Saved grass_dirt.png")
 
 # Combine character sprites into a single sprite sheet
@@ -91,7 +96,7 @@ if char_images:
     for i, img in enumerate(char_images):
         sprite_sheet.paste(img, (i * char_width, 0))
 
-    sprite_sheet.save(f'{char_dir}/lobster_character.png')
+    save_atomic(sprite_sheet, f'{char_dir}/lobster_character.png')
     print(f"✅ Saved lobster_character.png ({char_width * 4}x{char_height})")
 
-print("\n🎉 All sprites extracted successfully!")
+print(f"\n🎉 All sprites extracted successfully! ({summary()})")
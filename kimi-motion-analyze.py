@@ -1,39 +1,232 @@
 #!/usr/bin/env python3
 """
 Motion analysis - send multiple frames to Kimi for animation feedback
-Usage: python kimi-motion-analyze.py <frames_dir> [prompt]
+Usage: python kimi-motion-analyze.py [video_or_frames_dir] [prompt] [--frames 5] [--fps 10]
+
+Videos (e.g. playtest-videos/gameplay_*.mp4) are decoded by ffmpeg straight
+into NumPy through a rawvideo pipe; nothing is written to disk. Frames are
+picked on the fly by scene-change score (how much each frame differs from
+the previous one), so the model sees the moments where something happens.
+A directory of frame_*.png files (playtest-video.js output) still works.
 """
 
-import openai
+import argparse
 import base64
+import glob
+import io
+import json
 import os
+import shutil
+import subprocess
 import sys
-import glob
+
+import numpy as np
+from PIL import Image
+
+DEFAULT_SOURCE_DIR = 'playtest-videos'
+VIDEO_EXTENSIONS = ('.mp4', '.webm', '.mov', '.mkv', '.avi', '.gif')
+# Frames are scored on a downsampled grayscale copy (every Nth pixel)
+SCORE_STRIDE = 4
+# Time buckets kept per requested frame while streaming (one candidate each)
+CANDIDATES_PER_FRAME = 4
+
+
+def video_size(video_path):
+    """(width, height) of the first video stream, via ffprobe"""
+    result = subprocess.run(
+        ['ffprobe', '-v', 'error', '-select_streams', 'v:0',
+         '-show_entries', 'stream=width,height', '-of', 'json', video_path],
+        capture_output=True, text=True, check=True
+    )
+    stream = json.loads(result.stdout)['streams'][0]
+    return stream['width'], stream['height']
+
+
+def stream_video(video_path, fps=None):
+    """Yield (timestamp_seconds, RGB frame array) decoded through an ffmpeg pipe"""
+    width, height = video_size(video_path)
+    rate = fps or video_fps(video_path)
+    filters = ['-vf', f'fps={fps}'] if fps else []
+    process = subprocess.Popen(
+        ['ffmpeg', '-v', 'error', '-i', video_path, *filters,
+         '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-'],
+        stdout=subprocess.PIPE
+    )
+    frame_bytes = width * height * 3
+    index = 0
+    try:
+        while True:
+            data = process.stdout.read(frame_bytes)
+            if len(data) < frame_bytes:
+                break
+            yield index / rate, np.frombuffer(data, np.uint8).reshape(height, width, 3)
+            index += 1
+    finally:
+        process.stdout.close()
+        process.kill()
+        process.wait()
+
+
+def video_fps(video_path):
+    """Average frame rate of the first video stream (for timestamps)"""
+    result = subprocess.run(
+        ['ffprobe', '-v', 'error', '-select_streams', 'v:0',
+         '-show_entries', 'stream=avg_frame_rate', '-of', 'csv=p=0', video_path],
+        capture_output=True, text=True, check=True
+    )
+    num, _, den = result.stdout.strip().partition('/')
+    return float(num) / float(den or 1) if float(num or 0) else 10.0
+
+
+def stream_frame_dir(frames_dir, fps=10):
+    """Yield (timestamp_seconds, RGB frame array) from frame_*.png, one file at a time"""
+    for index, frame_path in enumerate(sorted(glob.glob(f'{frames_dir}/frame_*.png'))):
+        with Image.open(frame_path) as image:
+            yield index / fps, np.asarray(image.convert('RGB'))
+
+
+def luma(frame):
+    """Downsampled grayscale copy of an RGB frame, for scoring"""
+    small = frame[::SCORE_STRIDE, ::SCORE_STRIDE].astype(np.float32)
+    return small @ np.array([0.299, 0.587, 0.114], np.float32)
+
+
+def scene_score(previous, current):
+    """Mean absolute luma difference between two frames, 0..1"""
+    return float(np.abs(current - previous).mean()) / 255.0
+
+
+def select_frames(frames, count=5):
+    """Pick `count` frames from a stream by scene-change score.
+
+    While streaming, the timeline is split into equal buckets and only the
+    best-scoring frame of each is kept; when there are too many buckets,
+    neighbours merge, so memory stays bounded and candidates stay spread
+    over the whole video. The pick is the first and last frame, then the
+    highest scores that aren't too close together, then frames filling the
+    widest gaps, so exactly min(count, total) frames come back even when
+    all the action is in one transition or the video is static.
+    Returns (selected [(index, time, score, frame)], total_frames).
+    """
+    max_buckets = max(2, count * CANDIDATES_PER_FRAME)
+    bucket_width = 1
+    buckets = {}  # bucket -> (score, index, time, frame)
+    first = last = None
+    previous = None
+    total = 0
+
+    for index, (timestamp, frame) in enumerate(frames):
+        current = luma(frame)
+        score = scene_score(previous, current) if previous is not None else 0.0
+        previous = current
+        total = index + 1
+
+        entry = (score, index, timestamp, frame)
+        if first is None:
+            first = entry
+        last = entry
+
+        bucket = index // bucket_width
+        if bucket not in buckets or score > buckets[bucket][0]:
+            buckets[bucket] = entry
+        if len(buckets) > max_buckets:
+            bucket_width *= 2
+            merged = {}
+            for key, kept in buckets.items():
+                if key // 2 not in merged or kept[0] > merged[key // 2][0]:
+                    merged[key // 2] = kept
+            buckets = merged
+
+    if first is None:
+        return [], 0
+
+    wanted = min(count, total)
+    chosen = {first[1]: first}
+    if wanted > 1:
+        chosen[last[1]] = last
+    candidates = [e for e in buckets.values() if e[1] not in chosen]
+
+    # Biggest scene changes first, kept apart from each other
+    min_gap = max(1, total // (wanted * 2))
+    for entry in sorted(candidates, key=lambda e: -e[0]):
+        if len(chosen) >= wanted:
+            break
+        if entry[0] > 0 and all(abs(entry[1] - i) >= min_gap for i in chosen):
+            chosen[entry[1]] = entry
+
+    # Fill the rest from the middle of the widest gaps between picks
+    while len(chosen) < wanted:
+        remaining = [e for e in candidates if e[1] not in chosen]
+        if not remaining:
+            break
+        picks = sorted(chosen)
+        left, right = max(zip(picks, picks[1:]), key=lambda gap: gap[1] - gap[0])
+        middle = (left + right) / 2
+        entry = min(remaining, key=lambda e: abs(e[1] - middle))
+        chosen[entry[1]] = entry
+
+    selected = [(index, timestamp, score, frame) for score, index, timestamp, frame in chosen.values()]
+    return sorted(selected, key=lambda s: s[0]), total
+
+
+def encode_png(frame):
+    """Encode an RGB frame array as base64 PNG (only done for selected frames)"""
+    buffer = io.BytesIO()
+    Image.fromarray(frame).save(buffer, format='PNG', optimize=False)
+    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+
+
+def default_source():
+    """Newest playtest video, else the extracted frames directory"""
+    videos = [p for ext in VIDEO_EXTENSIONS for p in glob.glob(f'{DEFAULT_SOURCE_DIR}/*{ext}')]
+    if videos:
+        return max(videos, key=os.path.getmtime)
+    return f'{DEFAULT_SOURCE_DIR}/frames'
+
 
 def main():
+    parser = argparse.ArgumentParser(description='Send key frames from a playtest video to Kimi for motion analysis')
+    parser.add_argument('source', nargs='?', help='video file or directory of frame_*.png (default: newest playtest video)')
+    parser.add_argument('prompt', nargs='?', help='custom analysis prompt')
+    parser.add_argument('--frames', type=int, default=5, help='number of frames to send (default: 5)')
+    parser.add_argument('--fps', type=float, help='decode videos at this frame rate (default: native)')
+    parser.add_argument('--select-only', action='store_true', help='print the selected frames without calling the API')
+    args = parser.parse_args()
+
     api_key = os.environ.get('NVIDIA_API_KEY')
-    if not api_key:
+    if not api_key and not args.select_only:
         print("❌ Set NVIDIA_API_KEY environment variable")
         sys.exit(1)
-    
-    frames_dir = sys.argv[1] if len(sys.argv) > 1 else 'playtest-videos/frames'
-    custom_prompt = sys.argv[2] if len(sys.argv) > 2 else None
-    
-    # Get frame files (sample every 5th frame for efficiency)
-    frames = sorted(glob.glob(f'{frames_dir}/frame_*.png'))
-    if not frames:
-        print(f"❌ No frames found in {frames_dir}")
+
+    source = args.source or default_source()
+    custom_prompt = args.prompt
+
+    if os.path.isfile(source):
+        if not shutil.which('ffmpeg') or not shutil.which('ffprobe'):
+            print("❌ ffmpeg/ffprobe not found - install ffmpeg or pass a frames directory")
+            sys.exit(1)
+        print(f"🎞️ Streaming {source} through ffmpeg...")
+        frames = stream_video(source, args.fps)
+    else:
+        frames = stream_frame_dir(source)
+
+    selected, total = select_frames(frames, args.frames)
+    if not selected:
+        print(f"❌ No frames found in {source}")
         sys.exit(1)
-    
-    # Sample frames for motion analysis (first, middle, last + some in between)
-    sample_indices = [0, len(frames)//4, len(frames)//2, 3*len(frames)//4, len(frames)-1]
-    sample_frames = [frames[i] for i in sample_indices if i < len(frames)]
-    
-    print(f"🎬 Analyzing {len(sample_frames)} frames from {len(frames)} total...")
-    
+
+    print(f"🎬 Analyzing {len(selected)} frames from {total} total...")
+    for index, timestamp, score, _ in selected:
+        print(f"   #{index:<5} t={timestamp:6.2f}s  scene change {score:.3f}")
+
+    if args.select_only:
+        return
+
+    import openai
+
     # Encode frames
     content = []
-    
+
     default_prompt = """Analyze this sequence of game frames for motion/animation issues:
 
 1. WALK ANIMATION: Is the walking cycle smooth? Look for jerky movements, missing frames, or wrong directions
@@ -45,26 +238,24 @@ def main():
 These frames are sequential - analyze the motion between them. Be specific about timing issues."""
 
     content.append({'type': 'text', 'text': custom_prompt or default_prompt})
-    
-    for i, frame_path in enumerate(sample_frames):
-        with open(frame_path, 'rb') as f:
-            b64 = base64.b64encode(f.read()).decode('utf-8')
+
+    for i, (index, timestamp, score, frame) in enumerate(selected):
         content.append({
-            'type': 'text', 
-            'text': f'\n--- Frame {i+1}/{len(sample_frames)} (from sequence) ---'
+            'type': 'text',
+            'text': f'\n--- Frame {i+1}/{len(selected)} (t={timestamp:.2f}s, frame {index} of {total}) ---'
         })
         content.append({
             'type': 'image_url',
-            'image_url': {'url': f'data:image/png;base64,{b64}'}
+            'image_url': {'url': f'data:image/png;base64,{encode_png(frame)}'}
         })
-    
+
     client = openai.OpenAI(
         api_key=api_key,
         base_url="https://integrate.api.nvidia.com/v1"
     )
-    
+
     print("🔍 Sending to Kimi K2.5...")
-    
+
     try:
         response = client.chat.completions.create(
             model='moonshotai/kimi-k2.5',
@@ -75,11 +266,11 @@ These frames are sequential - analyze the motion between them. Be specific about
             max_tokens=2048,
             extra_body={'thinking': {'type': 'disabled'}}
         )
-        
+
         print("-" * 50)
         print("\n💡 MOTION ANALYSIS:")
         print(response.choices[0].message.content)
-        
+
     except Exception as e:
         print(f"❌ Error: {e}")
         sys.exit(1)
@@ -4,23 +4,31 @@ Kimi K2.5 Visual Analysis for Claw World
 Captures game screenshots and sends them to Kimi for visual bug detection
 """
 
-import openai
+import argparse
 import base64
 import os
 import sys
 import subprocess
 import time
 import json
+import urllib.error
+import urllib.request
 from pathlib import Path
 
 # Config
 NVIDIA_API_KEY = os.environ.get('NVIDIA_API_KEY')
 MODEL_NAME = 'moonshotai/kimi-k2.5'
 SCREENSHOT_DIR = Path('./kimi-screenshots')
-GAME_URL = 'http://localhost:8080'
+GAME_URL = 'http://localhost:8080/game.html'
+CAPTURE_SERVICE_PORT = int(os.environ.get('SCREENSHOT_SERVICE_PORT', 8790))
+CAPTURE_SERVICE_URL = f'http://127.0.0.1:{CAPTURE_SERVICE_PORT}'
+CAPTURE_SERVICE_SCRIPT = Path(__file__).parent / 'screenshot-service.js'
+CAPTURE_SCENARIOS = ['welcome', 'game_view', 'walking_right', 'near_building', 'interior', 'debug_mode']
 
 def setup_client():
     """Setup OpenAI client for NVIDIA NIM"""
+    import openai
+
     if not NVIDIA_API_KEY:
         print("❌ NVIDIA_API_KEY environment variable not set")
         print("   Get your key from: https://build.nvidia.com/moonshotai/kimi-k2.5")
@@ -32,17 +40,18 @@ def setup_client():
         base_url="https://integrate.api.nvidia.com/v1"
     )
 
-def encode_image(image_path):
-    """Encode image to base64"""
-    with open(image_path, 'rb') as f:
-        return base64.b64encode(f.read()).decode('utf-8')
+def encode_image(image):
+    """Encode PNG bytes (or a file path) to base64"""
+    if isinstance(image, (str, Path)):
+        image = Path(image).read_bytes()
+    return base64.b64encode(image).decode('utf-8')
 
-def analyze_image(client, image_path, prompt, use_thinking=True):
-    """Send image to Kimi for analysis"""
-    print(f"\n🔍 Analyzing: {image_path}")
+def analyze_image(client, name, image, prompt, use_thinking=True):
+    """Send image (PNG bytes or path) to Kimi for analysis"""
+    print(f"\n🔍 Analyzing: {name}")
     print(f"   Prompt: {prompt[:80]}...")
     
-    base64_image = encode_image(image_path)
+    base64_image = encode_image(image)
     
     messages = [
         {
@@ -103,149 +112,118 @@ Focus on actionable issues a developer can fix.'''
         print(f"❌ API Error: {e}")
         return None
 
-def capture_screenshots():
-    """Use Puppeteer to capture game screenshots"""
-    SCREENSHOT_DIR.mkdir(exist_ok=True)
-    
-    # Node.js script to capture screenshots
-    capture_script = '''
-const puppeteer = require('puppeteer');
+def service_request(path, payload=None, timeout=5):
+    """Call the screenshot service; returns parsed JSON"""
+    data = json.dumps(payload).encode('utf-8') if payload is not None else None
+    request = urllib.request.Request(
+        f'{CAPTURE_SERVICE_URL}{path}',
+        data=data,
+        headers={'Content-Type': 'application/json'}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        # The service reports bad requests as {"error": ...}; anything else
+        # on the port (a proxy, another server) may not answer in JSON
+        try:
+            return json.loads(e.read())
+        except ValueError:
+            return {'error': f'HTTP {e.code}'}
 
-(async () => {
-    const browser = await puppeteer.launch({ 
-        headless: false,
-        defaultViewport: { width: 800, height: 600 }
-    });
-    const page = await browser.newPage();
-    
-    console.log('Loading game...');
-    await page.goto('http://localhost:8080', { waitUntil: 'networkidle0' });
-    await new Promise(r => setTimeout(r, 2000));
-    
-    // Screenshot 1: Welcome screen
-    console.log('📸 Capturing welcome screen...');
-    await page.screenshot({ path: './kimi-screenshots/01_welcome.png' });
-    
-    // Quick character creation
-    try {
-        await page.click('button');
-        await new Promise(r => setTimeout(r, 500));
-        
-        const nameInput = await page.$('input[type="text"]');
-        if (nameInput) {
-            await nameInput.type('TestCrab');
-        }
-        
-        // Find and click Enter World
-        const buttons = await page.$$('button');
-        for (const btn of buttons) {
-            const text = await btn.evaluate(el => el.textContent);
-            if (text.includes('Enter World')) {
-                await btn.click();
-                break;
-            }
-        }
-        await new Promise(r => setTimeout(r, 2000));
-    } catch (e) {
-        console.log('Character creation skipped (may be returning player)');
-        await new Promise(r => setTimeout(r, 1000));
-    }
-    
-    // Screenshot 2: Initial game view
-    console.log('📸 Capturing game view...');
-    await page.screenshot({ path: './kimi-screenshots/02_game_view.png' });
-    
-    // Walk around to show character animation
-    const holdKey = async (key, ms) => {
-        await page.keyboard.down(key);
-        await new Promise(r => setTimeout(r, ms));
-        await page.keyboard.up(key);
-    };
-    
-    // Screenshot 3: Walking (try to capture mid-animation)
-    console.log('📸 Capturing character walking...');
-    await page.keyboard.down('d');
-    await new Promise(r => setTimeout(r, 200));
-    await page.screenshot({ path: './kimi-screenshots/03_walking_right.png' });
-    await new Promise(r => setTimeout(r, 300));
-    await page.keyboard.up('d');
-    
-    // Screenshot 4: Near a building
-    console.log('📸 Navigating near buildings...');
-    await holdKey('s', 1500);
-    await holdKey('d', 1000);
-    await new Promise(r => setTimeout(r, 300));
-    await page.screenshot({ path: './kimi-screenshots/04_near_building.png' });
-    
-    // Try to enter a building
-    console.log('📸 Attempting building entry...');
-    await holdKey('w', 1500);
-    await new Promise(r => setTimeout(r, 500));
-    await page.screenshot({ path: './kimi-screenshots/05_building_attempt.png' });
-    
-    // Check if we're inside
-    const state = await page.evaluate(() => window.game?.currentLocation);
-    if (state === 'interior') {
-        console.log('📸 Inside building!');
-        await page.screenshot({ path: './kimi-screenshots/06_interior.png' });
-    }
-    
-    // Enable debug mode and screenshot
-    console.log('📸 Enabling debug mode...');
-    await page.keyboard.press('Backquote');
-    await new Promise(r => setTimeout(r, 300));
-    await page.screenshot({ path: './kimi-screenshots/07_debug_mode.png' });
-    
-    console.log('✅ Screenshots captured!');
-    await browser.close();
-})();
-'''
-    
-    script_path = SCREENSHOT_DIR / 'capture.js'
-    script_path.write_text(capture_script)
-    
-    print("📷 Capturing game screenshots...")
-    result = subprocess.run(
-        ['node', str(script_path)],
-        cwd=str(Path('.').absolute()),
-        capture_output=True,
-        text=True,
-        timeout=60
+def ensure_capture_service():
+    """Start screenshot-service.js in the background unless it's already running"""
+    try:
+        return service_request('/health')
+    except OSError:
+        pass
+
+    print("🌐 Starting screenshot service (stays up between runs)...")
+    subprocess.Popen(
+        ['node', str(CAPTURE_SERVICE_SCRIPT), '--port', str(CAPTURE_SERVICE_PORT)],
+        cwd=str(CAPTURE_SERVICE_SCRIPT.parent),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
     )
-    
-    if result.returncode != 0:
-        print(f"⚠️ Capture warnings: {result.stderr}")
-    
-    print(result.stdout)
-    
-    # Return list of captured screenshots
-    screenshots = sorted(SCREENSHOT_DIR.glob('*.png'))
-    print(f"📸 Captured {len(screenshots)} screenshots")
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            return service_request('/health')
+        except OSError:
+            time.sleep(0.2)
+    print("❌ Screenshot service did not start (is puppeteer installed? try: node screenshot-service.js)")
+    sys.exit(1)
+
+def capture_screenshots(scenarios=CAPTURE_SCENARIOS, save=False):
+    """Capture game scenarios through the persistent screenshot service.
+
+    Returns {scenario_name: png_bytes}; images stay in memory unless save=True.
+    """
+    ensure_capture_service()
+
+    print(f"📷 Capturing {len(scenarios)} scenarios in parallel...")
+    result = service_request('/capture', {
+        'gameUrl': GAME_URL,
+        'scenarios': list(scenarios)
+    }, timeout=120)
+
+    if 'error' in result:
+        print(f"❌ Capture failed: {result['error']}")
+        return {}
+    for name, error in result['errors'].items():
+        print(f"⚠️ {name}: {error}")
+
+    screenshots = {
+        name: base64.b64decode(image)
+        for name, image in result['screenshots'].items()
+    }
+    print(f"📸 Captured {len(screenshots)} screenshots in {result['timings']['total'] / 1000:.1f}s")
+
+    if save:
+        SCREENSHOT_DIR.mkdir(exist_ok=True)
+        for i, name in enumerate(scenarios, 1):
+            if name in screenshots:
+                (SCREENSHOT_DIR / f'{i:02d}_{name}.png').write_bytes(screenshots[name])
+        print(f"💾 Saved to {SCREENSHOT_DIR}/")
+
     return screenshots
 
 def main():
+    parser = argparse.ArgumentParser(description='Capture Claw World screenshots and analyze them with Kimi')
+    parser.add_argument('--scenarios', nargs='+', default=CAPTURE_SCENARIOS,
+                        help=f'scenarios to capture (default: all of {", ".join(CAPTURE_SCENARIOS)})')
+    parser.add_argument('--save', action='store_true', help=f'also write captures to {SCREENSHOT_DIR}/')
+    parser.add_argument('--existing', action='store_true', help=f'analyze PNGs already in {SCREENSHOT_DIR}/ instead of capturing')
+    parser.add_argument('--capture-only', action='store_true', help='capture (and --save) without calling the API')
+    parser.add_argument('--stop-service', action='store_true', help='shut down the screenshot service and exit')
+    args = parser.parse_args()
+
+    if args.stop_service:
+        try:
+            service_request('/shutdown', {})
+            print("👋 Screenshot service stopped")
+        except OSError:
+            print("Screenshot service is not running")
+        return
+
     print("🦀 Kimi K2.5 Visual Analysis for Claw World")
     print("=" * 50)
     
-    client = setup_client()
+    client = None if args.capture_only else setup_client()
     
-    # Check if screenshots already exist or capture new ones
-    existing = list(SCREENSHOT_DIR.glob('*.png')) if SCREENSHOT_DIR.exists() else []
-    
-    if existing and len(existing) >= 3:
-        print(f"Found {len(existing)} existing screenshots. Use these? (y/n/capture)")
-        choice = input().strip().lower()
-        if choice == 'capture' or choice == 'n':
-            screenshots = capture_screenshots()
-        else:
-            screenshots = sorted(existing)
+    if args.existing:
+        screenshots = {path.stem: path.read_bytes() for path in sorted(SCREENSHOT_DIR.glob('*.png'))}
     else:
-        screenshots = capture_screenshots()
+        screenshots = capture_screenshots(args.scenarios, save=args.save)
     
     if not screenshots:
         print("❌ No screenshots to analyze")
         return
     
+    if args.capture_only:
+        return
+    
     # Analysis prompts for different screenshot types
     prompts = {
         'welcome': "Analyze this game welcome/title screen. Check for: text readability, button alignment, visual balance, any pixel art issues, overall UI layout quality.",
@@ -258,8 +236,8 @@ def main():
     
     # Analyze each screenshot
     results = []
-    for screenshot in screenshots:
-        name = screenshot.stem.lower()
+    for screenshot, image in screenshots.items():
+        name = screenshot.lower()
         
         # Pick appropriate prompt
         if 'welcome' in name:
@@ -275,10 +253,10 @@ def main():
         else:
             prompt = prompts['game_view']
         
-        result = analyze_image(client, screenshot, prompt, use_thinking=True)
+        result = analyze_image(client, screenshot, image, prompt, use_thinking=True)
         if result:
             results.append({
-                'screenshot': str(screenshot),
+                'screenshot': screenshot,
                 'analysis': result
             })
         
@@ -286,6 +264,7 @@ def main():
         time.sleep(1)
     
     # Save results
+    SCREENSHOT_DIR.mkdir(exist_ok=True)
     report_path = SCREENSHOT_DIR / 'analysis_report.json'
     with open(report_path, 'w') as f:
         json.dump(results, f, indent=2)
@@ -297,7 +276,7 @@ def main():
     print("📋 SUMMARY")
     print("=" * 50)
     for r in results:
-        print(f"\n📸 {Path(r['screenshot']).name}:")
+        print(f"\n📸 {r['screenshot']}:")
         content = r['analysis']['content']
         # Print first 300 chars of each analysis
         print(f"   {content[:300]}..." if len(content) > 300 else f"   {content}")
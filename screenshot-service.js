@@ -0,0 +1,300 @@
+/**
+ * Screenshot capture service for visual analysis (kimi-visual-analysis.py)
+ *
+ * Keeps one headless browser alive between runs and serves captures over HTTP:
+ *   GET  /health    -> { ok, browser, scenarios }
+ *   POST /capture   -> { screenshots: { name: base64 PNG }, timings, errors }
+ *                      body: { gameUrl?, scenarios?, viewport? }
+ *   POST /shutdown  -> closes the browser and exits
+ *
+ * Each scenario runs in its own page (and browser context, so localStorage
+ * doesn't leak between them) in parallel. Scenarios wait on game state
+ * (window.game) and rendered frames instead of fixed sleeps.
+ *
+ * Usage: node screenshot-service.js [--port 8790] [--idle-minutes 15]
+ */
+
+const http = require('http');
+const puppeteer = require('puppeteer');
+
+const args = process.argv.slice(2);
+const argValue = (name, fallback) => {
+    const i = args.indexOf(name);
+    return i >= 0 && args[i + 1] ? args[i + 1] : fallback;
+};
+
+const PORT = parseInt(argValue('--port', process.env.SCREENSHOT_SERVICE_PORT || '8790'), 10);
+const IDLE_MS = parseFloat(argValue('--idle-minutes', '15')) * 60 * 1000;
+const DEFAULT_GAME_URL = 'http://localhost:8080/game.html';
+const DEFAULT_VIEWPORT = { width: 800, height: 600 };
+const READY_TIMEOUT = 20000;
+// Skip menus and keep runs deterministic (no server connection, no reload polling)
+const GAME_PARAMS = 'quickStart=true&mp=false&livereload=false';
+
+let browser = null;
+// In-flight puppeteer.launch(), shared by parallel scenarios so only one Chromium starts
+let launching = null;
+let idleTimer = null;
+
+function log(msg) {
+    console.log(`[${new Date().toISOString().substr(11, 8)}] ${msg}`);
+}
+
+async function getBrowser() {
+    if (browser && browser.connected) return browser;
+    if (!launching) {
+        log('🌐 Launching headless browser...');
+        launching = puppeteer.launch({
+            // chrome-headless-shell: no UI process, fastest startup for screenshots
+            headless: 'shell',
+            args: ['--no-sandbox', '--disable-background-timer-throttling', '--disable-renderer-backgrounding']
+        }).then((launched) => {
+            browser = launched;
+            launched.on('disconnected', () => {
+                if (browser === launched) browser = null;
+            });
+            return launched;
+        }).finally(() => {
+            launching = null;
+        });
+    }
+    return launching;
+}
+
+function resetIdleTimer() {
+    clearTimeout(idleTimer);
+    idleTimer = setTimeout(() => shutdown('idle timeout'), IDLE_MS);
+}
+
+async function shutdown(reason) {
+    log(`👋 Shutting down (${reason})`);
+    clearTimeout(idleTimer);
+    if (browser) await browser.close().catch(() => {});
+    process.exit(0);
+}
+
+// ============ Readiness helpers ============
+
+// Wait until the game loop is running with a player in the world
+async function waitForGame(page) {
+    await page.waitForFunction(
+        () => window.game && window.game.running && window.game.player && window.game.worldMap && !window.game.isTransitioning,
+        { timeout: READY_TIMEOUT }
+    );
+    await waitForFrames(page, 2);
+}
+
+// Wait for the browser to paint a couple of frames
+async function waitForFrames(page, count = 2) {
+    await page.evaluate((n) => new Promise(resolve => {
+        const step = () => (n-- <= 0 ? resolve() : requestAnimationFrame(step));
+        requestAnimationFrame(step);
+    }), count);
+}
+
+// Snap the camera onto the player instead of waiting for the lerp to catch up
+async function snapCamera(page) {
+    await page.evaluate(() => {
+        const { camera, player } = window.game;
+        camera.position.x = player.position.x - camera.viewportWidth / 2;
+        camera.position.y = player.position.y - camera.viewportHeight / 2;
+        camera.clampToWorld();
+    });
+}
+
+// ============ Scenarios ============
+// Each entry: { query, prepare(page) }; the screenshot is taken once prepare resolves.
+
+const SCENARIOS = {
+    welcome: {
+        query: 'livereload=false',
+        prepare: async (page) => {
+            await page.waitForFunction(
+                () => [...document.querySelectorAll('button')].some(b => b.offsetParent !== null),
+                { timeout: READY_TIMEOUT }
+            );
+            await page.evaluate(() => document.fonts.ready);
+            await waitForFrames(page, 2);
+        }
+    },
+
+    game_view: {
+        query: GAME_PARAMS,
+        prepare: async (page) => {
+            await waitForGame(page);
+            await snapCamera(page);
+            await waitForFrames(page, 2);
+        }
+    },
+
+    walking_right: {
+        query: GAME_PARAMS,
+        prepare: async (page) => {
+            await waitForGame(page);
+            await snapCamera(page);
+            const startX = await page.evaluate(() => window.game.player.position.x);
+            // Held until after the screenshot so it shows a mid-walk frame
+            await page.keyboard.down('d');
+            await page.waitForFunction(
+                (x) => window.game.player.position.x > x + 8,
+                { timeout: READY_TIMEOUT },
+                startX
+            );
+        },
+        cleanup: async (page) => {
+            await page.keyboard.up('d');
+        }
+    },
+
+    near_building: {
+        query: GAME_PARAMS,
+        prepare: async (page) => {
+            await waitForGame(page);
+            const found = await page.evaluate(() => {
+                const { player, buildings } = window.game;
+                let best = null;
+                let bestDist = Infinity;
+                for (const building of buildings) {
+                    const door = building.getDoorBounds();
+                    const dist = Math.hypot(door.x - player.position.x, door.y - player.position.y);
+                    if (dist < bestDist) {
+                        best = door;
+                        bestDist = dist;
+                    }
+                }
+                if (!best) return false;
+                // Stand a little below the door so auto-enter doesn't trigger
+                player.position.x = best.x + best.width / 2 - player.width / 2;
+                player.position.y = best.y + best.height + 24;
+                return true;
+            });
+            if (!found) throw new Error('no buildings in world');
+            await snapCamera(page);
+            await waitForFrames(page, 3);
+        }
+    },
+
+    interior: {
+        query: GAME_PARAMS,
+        prepare: async (page) => {
+            await waitForGame(page);
+            const entered = await page.evaluate(() => {
+                const game = window.game;
+                const building = game.buildings.find(b => b.type !== 'lighthouse');
+                if (!building) return false;
+                game.enterBuilding(building);
+                return true;
+            });
+            if (!entered) throw new Error('no enterable buildings in world');
+            await page.waitForFunction(
+                () => window.game.currentLocation === 'interior' && !window.game.isTransitioning,
+                { timeout: READY_TIMEOUT }
+            );
+            await snapCamera(page);
+            await waitForFrames(page, 3);
+        }
+    },
+
+    debug_mode: {
+        query: `${GAME_PARAMS}&debug=true`,
+        prepare: async (page) => {
+            await waitForGame(page);
+            await snapCamera(page);
+            await waitForFrames(page, 2);
+        }
+    }
+};
+
+async function captureScenario(name, gameUrl, viewport) {
+    const scenario = SCENARIOS[name];
+    const started = Date.now();
+    const context = await (await getBrowser()).createBrowserContext();
+    try {
+        const page = await context.newPage();
+        await page.setViewport(viewport);
+        const separator = gameUrl.includes('?') ? '&' : '?';
+        await page.goto(`${gameUrl}${separator}${scenario.query}`, { waitUntil: 'load', timeout: READY_TIMEOUT });
+        await scenario.prepare(page);
+        const image = await page.screenshot({ encoding: 'base64' });
+        if (scenario.cleanup) await scenario.cleanup(page);
+        return { name, image, ms: Date.now() - started };
+    } finally {
+        await context.close().catch(() => {});
+    }
+}
+
+async function capture({ gameUrl = DEFAULT_GAME_URL, scenarios = Object.keys(SCENARIOS), viewport = DEFAULT_VIEWPORT }) {
+    const unknown = scenarios.filter(name => !SCENARIOS[name]);
+    if (unknown.length) throw new Error(`unknown scenarios: ${unknown.join(', ')}`);
+
+    const started = Date.now();
+    const results = await Promise.allSettled(scenarios.map(name => captureScenario(name, gameUrl, viewport)));
+
+    const response = { screenshots: {}, timings: {}, errors: {} };
+    results.forEach((result, i) => {
+        const name = scenarios[i];
+        if (result.status === 'fulfilled') {
+            response.screenshots[name] = result.value.image;
+            response.timings[name] = result.value.ms;
+        } else {
+            response.errors[name] = result.reason.message;
+        }
+    });
+    response.timings.total = Date.now() - started;
+    log(`📸 Captured ${Object.keys(response.screenshots).length}/${scenarios.length} in ${response.timings.total}ms`);
+    return response;
+}
+
+// ============ HTTP server ============
+
+function sendJson(res, status, body) {
+    res.writeHead(status, { 'Content-Type': 'application/json' });
+    res.end(JSON.stringify(body));
+}
+
+function readJson(req) {
+    return new Promise((resolve, reject) => {
+        let body = '';
+        req.on('data', chunk => { body += chunk; });
+        req.on('end', () => {
+            try {
+                resolve(body ? JSON.parse(body) : {});
+            } catch (e) {
+                reject(new Error('invalid JSON body'));
+            }
+        });
+        req.on('error', reject);
+    });
+}
+
+const server = http.createServer(async (req, res) => {
+    resetIdleTimer();
+    try {
+        if (req.method === 'GET' && req.url === '/health') {
+            sendJson(res, 200, { ok: true, browser: !!(browser && browser.connected), scenarios: Object.keys(SCENARIOS) });
+        } else if (req.method === 'POST' && req.url === '/capture') {
+            sendJson(res, 200, await capture(await readJson(req)));
+        } else if (req.method === 'POST' && req.url === '/shutdown') {
+            sendJson(res, 200, { ok: true });
+            shutdown('requested');
+        } else {
+            sendJson(res, 404, { error: 'not found' });
+        }
+    } catch (e) {
+        sendJson(res, 400, { error: e.message });
+    }
+});
+
+server.listen(PORT, '127.0.0.1', async () => {
+    log(`📷 Screenshot service listening on http://127.0.0.1:${PORT}`);
+    try {
+        await getBrowser();
+    } catch (e) {
+        log(`❌ Could not launch browser: ${e.message}`);
+        process.exit(1);
+    }
+    resetIdleTimer();
+});
+
+process.on('SIGINT', () => shutdown('SIGINT'));
+process.on('SIGTERM', () => shutdown('SIGTERM'));
@@ -1,21 +1,420 @@
 #!/usr/bin/env python3
-"""Simple HTTP server for development"""
+"""Simple HTTP server for development
 
+Also pushes live-reload events: whenever a PNG under client/assets is
+rewritten (e.g. by the tools/ --watch processors), every client subscribed
+to /__livereload receives the changed paths over Server-Sent Events and can
+hot-swap just those textures.
+
+Single byte ranges (Range: bytes=...) are answered with 206 Partial Content
+and streamed with sendfile, so seeking in the music MP3s never refetches
+the whole file. Multi-range requests are not supported and get the full
+200 response, which RFC 9110 allows.
+
+Every asset request is counted (status, bytes, latency histogram) and
+exposed in Prometheus text format at /__metrics. When the server stops
+(Ctrl+C or SIGTERM) the numbers are written to serve-metrics.json and the
+slowest assets are printed. 4xx
+responses are grouped under <not_found>/<client_error> instead of their path.
+
+Connections are HTTP/1.1 keep-alive on a threaded server, so a browser
+fetching hundreds of sprites at boot reuses a handful of sockets; idle
+connections are dropped after IDLE_TIMEOUT seconds.
+"""
+
+import bisect
 import http.server
-import socketserver
+import json
 import os
+import queue
+import re
+import signal
+import sys
+import threading
+import time
+from pathlib import Path
 
 PORT = 8080
+IDLE_TIMEOUT = 15
+LISTEN_BACKLOG = 128
 DIRECTORY = "client"
+ASSET_DIR = "assets"
+LIVERELOAD_PATH = "/__livereload"
+LIVERELOAD_PING_SECONDS = 15
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+METRICS_PATH = "/__metrics"
+METRICS_DUMP = "serve-metrics.json"
+# Shared metric labels for failed requests, so arbitrary URLs don't each add series
+NOT_FOUND_LABEL = "<not_found>"
+CLIENT_ERROR_LABEL = "<client_error>"
+SLOW_REPORT_SIZE = 10
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, float("inf"))
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "tools"))
+from asset_watch import watch  # noqa: E402
+
+
+class LiveReloadHub:
+    """Fan changed asset paths out to every connected SSE client."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscribers = set()
+
+    def subscribe(self):
+        q = queue.Queue()
+        with self.lock:
+            self.subscribers.add(q)
+        return q
+
+    def unsubscribe(self, q):
+        with self.lock:
+            self.subscribers.discard(q)
+
+    def publish(self, paths):
+        with self.lock:
+            for q in self.subscribers:
+                q.put(paths)
+
+
+hub = LiveReloadHub()
+
+
+class RequestMetrics:
+    """Per-path request counts, bytes sent, status codes and latencies."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.paths = {}
+
+    def record(self, path, status, nbytes, seconds):
+        with self.lock:
+            entry = self.paths.get(path)
+            if entry is None:
+                entry = self.paths[path] = {
+                    "requests": 0,
+                    "bytes": 0,
+                    "seconds": 0.0,
+                    "statuses": {},
+                    "buckets": [0] * len(LATENCY_BUCKETS),
+                }
+            entry["requests"] += 1
+            entry["bytes"] += nbytes
+            entry["seconds"] += seconds
+            entry["statuses"][status] = entry["statuses"].get(status, 0) + 1
+            entry["buckets"][bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                path: {**entry, "statuses": dict(entry["statuses"]), "buckets": list(entry["buckets"])}
+                for path, entry in self.paths.items()
+            }
+
+    def prometheus(self):
+        """Render the current counters in Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = [
+            "# HELP serve_requests_total Requests handled, by path and status.",
+            "# TYPE serve_requests_total counter",
+        ]
+        for path, entry in snapshot.items():
+            for status, count in sorted(entry["statuses"].items()):
+                lines.append(f'serve_requests_total{{path="{escape_label(path)}",status="{status}"}} {count}')
+
+        lines += [
+            "# HELP serve_response_bytes_total Body bytes sent, by path.",
+            "# TYPE serve_response_bytes_total counter",
+        ]
+        for path, entry in snapshot.items():
+            lines.append(f'serve_response_bytes_total{{path="{escape_label(path)}"}} {entry["bytes"]}')
+
+        lines += [
+            "# HELP serve_request_duration_seconds Time to handle a request, by path.",
+            "# TYPE serve_request_duration_seconds histogram",
+        ]
+        for path, entry in snapshot.items():
+            label = escape_label(path)
+            cumulative = 0
+            for le, count in zip(LATENCY_BUCKETS, entry["buckets"]):
+                cumulative += count
+                le_text = "+Inf" if le == float("inf") else repr(le)
+                lines.append(f'serve_request_duration_seconds_bucket{{path="{label}",le="{le_text}"}} {cumulative}')
+            lines.append(f'serve_request_duration_seconds_sum{{path="{label}"}} {entry["seconds"]:.6f}')
+            lines.append(f'serve_request_duration_seconds_count{{path="{label}"}} {entry["requests"]}')
+
+        total = sum(entry["requests"] for entry in snapshot.values())
+        not_modified = sum(entry["statuses"].get(304, 0) for entry in snapshot.values())
+        lines += [
+            "# HELP serve_not_modified_ratio Share of requests answered 304 from the browser cache.",
+            "# TYPE serve_not_modified_ratio gauge",
+            f"serve_not_modified_ratio {not_modified / total if total else 0.0:.6f}",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path):
+        snapshot = self.snapshot()
+        for entry in snapshot.values():
+            entry["buckets"] = dict(zip(map(str, LATENCY_BUCKETS), entry["buckets"]))
+        with open(path, "w") as f:
+            json.dump({"latency_buckets": list(map(str, LATENCY_BUCKETS)), "paths": snapshot}, f, indent=2)
+
+    def print_report(self, limit=SLOW_REPORT_SIZE):
+        """Print the assets that cost the most total serving time."""
+        snapshot = self.snapshot()
+        if not snapshot:
+            return
+        print(f"\n🐢 Slowest assets (top {limit} by total time):")
+        ranked = sorted(snapshot.items(), key=lambda item: item[1]["seconds"], reverse=True)
+        for path, entry in ranked[:limit]:
+            avg_ms = entry["seconds"] / entry["requests"] * 1000
+            print(f"  {entry['seconds'] * 1000:8.1f} ms total  {avg_ms:6.1f} ms avg  "
+                  f"{entry['requests']:4d} req  {entry['bytes'] / 1024:9.1f} KiB  {path}")
+
+
+def escape_label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metrics = RequestMetrics()
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_range(header, size):
+    """Parse a single-range Range header into an inclusive (start, end).
+
+    Returns None when the header should be ignored (malformed or
+    multi-range) and raises RangeNotSatisfiable when it can't be served.
+    """
+    match = RANGE_PATTERN.match(header.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+
+    if not first:
+        # Suffix range: the final N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiable()
+        return max(0, size - length), size - 1
+
+    start = int(first)
+    end = int(last) if last else size - 1
+    if last and end < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable()
+    return start, min(end, size - 1)
+
+
+class DevServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = LISTEN_BACKLOG
+
 
 class MyHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    # Persistent connections: every response must carry Content-Length
+    # (or close the connection, as the SSE stream does).
+    protocol_version = "HTTP/1.1"
+    timeout = IDLE_TIMEOUT
+    # Headers and body go out as separate writes; don't let Nagle stall them
+    disable_nagle_algorithm = True
+    # Error replies can be sent before timed() runs (bad request lines, 501s)
+    bytes_sent = 0
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=DIRECTORY, **kwargs)
 
+    def do_GET(self):
+        route = self.path.split("?", 1)[0]
+        if route == LIVERELOAD_PATH:
+            self.stream_livereload()
+            return
+        if route == METRICS_PATH:
+            self.send_metrics()
+            return
+        self.timed(super().do_GET)
+
+    def do_HEAD(self):
+        self.timed(super().do_HEAD)
+
+    def timed(self, handler):
+        self.status = 0
+        self.bytes_sent = 0
+        started = time.perf_counter()
+        try:
+            handler()
+        finally:
+            path = self.path.split("?", 1)[0]
+            if self.status == 404:
+                path = NOT_FOUND_LABEL
+            elif 400 <= self.status < 500:
+                path = CLIENT_ERROR_LABEL
+            metrics.record(path, self.status, self.bytes_sent, time.perf_counter() - started)
+
+    def send_response(self, code, message=None):
+        self.status = int(code)
+        super().send_response(code, message)
+
+    def send_header(self, keyword, value):
+        if keyword.lower() == "content-length":
+            self.content_length = int(value)
+        super().send_header(keyword, value)
+
+    def send_error(self, code, message=None, explain=None):
+        # Error bodies are written straight to wfile, not through copyfile;
+        # count them from the Content-Length they were sent with
+        self.content_length = 0
+        if code != http.server.HTTPStatus.NOT_FOUND:
+            super().send_error(code, message, explain)
+        else:
+            # Missing optional sprites are routine at boot; the stdlib would add
+            # Connection: close here, so answer 404s without dropping the socket.
+            body = b"File not found\n"
+            self.send_response(code, message)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(body)
+        if self.command != "HEAD":
+            self.bytes_sent += self.content_length
+
+    def send_metrics(self):
+        body = metrics.prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_head(self):
+        self.byte_range = None
+        path = self.translate_path(self.path)
+        self.accept_ranges = os.path.isfile(path)
+        range_header = self.headers.get("Range")
+        if not self.accept_ranges or range_header is None:
+            return super().send_head()
+
+        try:
+            f = open(path, "rb")
+        except OSError:
+            self.send_error(http.server.HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        try:
+            fs = os.fstat(f.fileno())
+            last_modified = self.date_time_string(fs.st_mtime)
+            # A stale If-Range validator means "ignore Range" (RFC 9110 13.1.5),
+            # so don't even parse it: a bad range must not turn into a 416
+            if_range = self.headers.get("If-Range")
+            if if_range is not None and if_range != last_modified:
+                f.close()
+                return super().send_head()
+
+            try:
+                byte_range = parse_range(range_header, fs.st_size)
+            except RangeNotSatisfiable:
+                f.close()
+                self.send_response(http.server.HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", f"bytes */{fs.st_size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return None
+
+            if byte_range is None:
+                f.close()
+                return super().send_head()
+
+            start, end = byte_range
+            self.send_response(http.server.HTTPStatus.PARTIAL_CONTENT)
+            self.send_header("Content-type", self.guess_type(path))
+            self.send_header("Content-Range", f"bytes {start}-{end}/{fs.st_size}")
+            self.send_header("Content-Length", str(end - start + 1))
+            self.send_header("Last-Modified", last_modified)
+            self.end_headers()
+            self.byte_range = byte_range
+            return f
+        except BaseException:
+            f.close()
+            raise
+
+    def end_headers(self):
+        if getattr(self, "accept_ranges", False):
+            self.send_header("Accept-Ranges", "bytes")
+            self.accept_ranges = False
+        super().end_headers()
+
+    def copyfile(self, source, outputfile):
+        """Stream straight from the page cache with sendfile (falls back to send)."""
+        if self.byte_range is None:
+            self.bytes_sent += self.connection.sendfile(source)
+        else:
+            start, end = self.byte_range
+            self.bytes_sent += self.connection.sendfile(source, offset=start, count=end - start + 1)
+
+    def stream_livereload(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        q = hub.subscribe()
+        try:
+            while True:
+                try:
+                    paths = q.get(timeout=LIVERELOAD_PING_SECONDS)
+                    message = f"data: {json.dumps({'paths': paths})}\n\n"
+                except queue.Empty:
+                    message = ": ping\n\n"
+                self.wfile.write(message.encode("utf-8"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            hub.unsubscribe(q)
+
+
+def watch_assets():
+    """Publish client-relative paths of rebuilt assets to the hub."""
+    root = Path(DIRECTORY).resolve()
+
+    def on_change(changed):
+        paths = sorted(p.resolve().relative_to(root).as_posix() for p in changed)
+        print(f"🔁 Live reload: {len(paths)} asset(s) changed")
+        hub.publish(paths)
+
+    # Recursive, so sprite folders created by the tools after startup are watched too
+    watch([root / ASSET_DIR], on_change, recursive=True)
+
+
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
-with socketserver.TCPServer(("", PORT), MyHTTPRequestHandler) as httpd:
+threading.Thread(target=watch_assets, daemon=True).start()
+
+with DevServer(("", PORT), MyHTTPRequestHandler) as httpd:
     print(f"🦞 ClawWorld Server running at http://localhost:{PORT}/")
     print(f"Serving files from: {os.path.abspath(DIRECTORY)}")
+    print(f"Live reload events at http://localhost:{PORT}{LIVERELOAD_PATH}")
+    print(f"Metrics at http://localhost:{PORT}{METRICS_PATH}")
     print("Press Ctrl+C to stop")
-    httpd.serve_forever()
+
+    # shutdown() blocks until serve_forever() returns, so it can't run on
+    # the main thread that the signal handler interrupts
+    signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=httpd.shutdown).start())
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        metrics.print_report()
+        metrics.dump(METRICS_DUMP)
+        print(f"\n📊 Request metrics saved to {os.path.abspath(METRICS_DUMP)}")
@@ -91,10 +91,6 @@ class MultiplayerServer {
                 players: this.getAllPlayers()
             }));
 
-            if (this.enemyManager) {
-                this.enemyManager.sendInitialState(ws);
-            }
-
             ws.on('message', (data) => {
                 try {
                     const msg = JSON.parse(data);
@@ -150,7 +146,8 @@ class MultiplayerServer {
                 player.ws.send(JSON.stringify({
                     type: 'joined',
                     player: player.data,
-                    players: this.getAllPlayers()
+                    players: this.getAllPlayers(),
+                    enemies: this.enemyManager ? this.enemyManager.getSnapshot() : []
                 }));
                 
                 // Broadcast to others
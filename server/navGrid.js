@@ -0,0 +1,125 @@
+/**
+ * navGrid.js — Precomputed navigation data for server bots
+ *
+ * Loads server/data/navgrid.bin (baked by tools/bake_navgrid.py) so bots can
+ * path with table lookups instead of trial-and-error collision checks:
+ * - walkability per cell (a bot standing at col*16, row*16)
+ * - connected components, to rule out unreachable targets up front
+ * - chunk-level region graph for long-range planning
+ * - distance + flow fields to points of interest (building doors, islands)
+ *
+ * Re-bake after map or collision changes; a missing file just disables it.
+ */
+
+const fs = require('fs');
+const path = require('path');
+const zlib = require('zlib');
+
+const NAV_GRID_PATH = path.join(__dirname, 'data', 'navgrid.bin');
+const MAGIC = 'CLAWNAV1';
+
+const TYPED_ARRAYS = {
+    uint8: Uint8Array,
+    uint16: Uint16Array,
+    uint32: Uint32Array,
+    int32: Int32Array
+};
+
+class NavGrid {
+    constructor(header, arrays) {
+        this.width = header.width;
+        this.height = header.height;
+        this.tileSize = header.tileSize;
+        this.chunkSize = header.chunkSize;
+        this.unreachable = header.unreachable;
+        this.directions = header.directions;
+        this.pois = header.pois;
+        this.poiIndex = new Map(this.pois.map((poi, i) => [poi.name.toLowerCase(), i]));
+        Object.assign(this, arrays);
+    }
+
+    // Load the baked file; returns null if it doesn't exist
+    static load(filePath = NAV_GRID_PATH) {
+        if (!fs.existsSync(filePath)) return null;
+
+        const file = fs.readFileSync(filePath);
+        if (file.toString('latin1', 0, 8) !== MAGIC) {
+            throw new Error(`${filePath} is not a nav grid file`);
+        }
+        const headerLength = file.readUInt32LE(8);
+        const header = JSON.parse(file.toString('utf8', 12, 12 + headerLength));
+        // Copy into a fresh buffer so every array offset is aligned
+        const payload = new Uint8Array(zlib.inflateSync(file.subarray(12 + headerLength)));
+
+        const arrays = {};
+        for (const [name, spec] of Object.entries(header.arrays)) {
+            const TypedArray = TYPED_ARRAYS[spec.dtype];
+            const length = spec.shape.reduce((a, b) => a * b, 1);
+            arrays[name] = new TypedArray(payload.buffer, spec.offset, length);
+        }
+        return new NavGrid(header, arrays);
+    }
+
+    inBounds(col, row) {
+        return col >= 0 && col < this.width && row >= 0 && row < this.height;
+    }
+
+    cellIndex(col, row) {
+        return row * this.width + col;
+    }
+
+    // Pixel position -> cell (bots move in whole 16px steps)
+    cellAt(x, y) {
+        return { col: Math.round(x / this.tileSize), row: Math.round(y / this.tileSize) };
+    }
+
+    isWalkable(col, row) {
+        return this.inBounds(col, row) && this.walkable[this.cellIndex(col, row)] === 1;
+    }
+
+    // Component id (0 = blocked)
+    component(col, row) {
+        return this.inBounds(col, row) ? this.components[this.cellIndex(col, row)] : 0;
+    }
+
+    isReachable(fromCol, fromRow, toCol, toRow) {
+        const component = this.component(fromCol, fromRow);
+        return component !== 0 && component === this.component(toCol, toRow);
+    }
+
+    // Region id in the chunk graph (0 = blocked)
+    region(col, row) {
+        return this.inBounds(col, row) ? this.regions[this.cellIndex(col, row)] : 0;
+    }
+
+    // Neighbouring regions of a region id: [{ region, cost }]
+    regionNeighbors(region) {
+        const neighbors = [];
+        for (let i = this.regionEdgeOffsets[region - 1]; i < this.regionEdgeOffsets[region]; i++) {
+            neighbors.push({ region: this.regionEdges[i] + 1, cost: this.regionEdgeCosts[i] });
+        }
+        return neighbors;
+    }
+
+    findPoi(name) {
+        const index = this.poiIndex.get(String(name).toLowerCase());
+        return index === undefined ? null : { index, ...this.pois[index] };
+    }
+
+    // Steps to a point of interest (null if unreachable)
+    distanceTo(poiIndex, col, row) {
+        if (!this.inBounds(col, row)) return null;
+        const distance = this.distances[poiIndex * this.width * this.height + this.cellIndex(col, row)];
+        return distance === this.unreachable ? null : distance;
+    }
+
+    // Next step toward a point of interest: 'north' | 'east' | 'south' | 'west',
+    // or null when already there or unreachable
+    nextDirection(poiIndex, col, row) {
+        if (!this.inBounds(col, row)) return null;
+        const code = this.flows[poiIndex * this.width * this.height + this.cellIndex(col, row)];
+        return this.directions[code] || null;
+    }
+}
+
+module.exports = { NavGrid, NAV_GRID_PATH };
@@ -20,6 +20,7 @@ const { Pool } = require('pg');
 const { generateTerrain, generateBuildings, isBoxWalkable, TILE_SIZE, WORLD_WIDTH, WORLD_HEIGHT } = require('./terrainMap');
 const { ServerCollisionSystem, getCharacterCollisionBox } = require('./serverCollisionSystem');
 const { EnemyManager } = require('./enemy/EnemyManager');
+const { NavGrid } = require('./navGrid');
 
 // ============================================
 // Configuration
@@ -48,6 +49,21 @@ const serverCollision = new ServerCollisionSystem(terrainData);
 serverCollision.setBuildings(buildings);
 serverCollision.setDecorations(terrainData.decorations || []);
 
+// Precomputed bot navigation (tools/bake_navgrid.py) — optional
+let navGrid = null;
+try {
+    navGrid = NavGrid.load();
+    if (navGrid && (navGrid.width !== terrainData.width || navGrid.height !== terrainData.height)) {
+        console.warn('⚠️ Nav grid does not match the terrain — re-run tools/bake_navgrid.py');
+        navGrid = null;
+    }
+} catch (e) {
+    console.warn('⚠️ Could not load nav grid:', e.message);
+}
+if (navGrid) {
+    console.log(`🧭 Nav grid loaded: ${navGrid.pois.length} points of interest`);
+}
+
 console.log(`🗺️ World loaded: ${terrainData.width}×${terrainData.height} tiles, ${buildings.length} buildings, ${(terrainData.decorations || []).length} decorations`);
 
 // ============================================
@@ -1575,6 +1591,36 @@ async function handleBotCommand(playerId, playerData, msg, ws) {
             break;
         }
 
+        case 'navigate': {
+            // Next step toward a named point of interest (building door or island)
+            if (!navGrid) {
+                ws.send(JSON.stringify({ type: 'error', message: 'Navigation data not available' }));
+                return;
+            }
+
+            const target = data?.target ? navGrid.findPoi(data.target) : null;
+            if (!target) {
+                ws.send(JSON.stringify({
+                    type: 'error',
+                    message: data?.target ? `Unknown destination: ${data.target}` : 'Target required',
+                    destinations: navGrid.pois.map(p => p.name)
+                }));
+                return;
+            }
+
+            const { col, row } = navGrid.cellAt(playerData.x, playerData.y);
+            const distance = navGrid.distanceTo(target.index, col, row);
+            ws.send(JSON.stringify({
+                type: 'navigation',
+                target: target.name,
+                direction: navGrid.nextDirection(target.index, col, row),
+                steps: distance,
+                reachable: distance !== null,
+                arrived: distance === 0
+            }));
+            break;
+        }
+
         case 'enter_building': {
             if (!playerData.name) {
                 ws.send(JSON.stringify({ type: 'error', message: 'Join first' }));
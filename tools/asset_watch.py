@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Directory watching for the Claw World asset tools (--watch mode).
+
+Uses Linux inotify through ctypes when available and falls back to polling
+file mtimes everywhere else. Bursts of saves are debounced so an image
+editor writing several files triggers a single rebuild. With recursive=True
+whole trees are watched, including subdirectories created later.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from pathlib import Path
+
+DEBOUNCE_SECONDS = 0.25
+POLL_INTERVAL = 0.5
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_IGNORED = 0x8000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def is_watched_file(path):
+    """Only PNGs count; dotfiles are temp files from asset_writer."""
+    return path.suffix.lower() == '.png' and not path.name.startswith('.')
+
+
+def walk_directories(directories):
+    """Every directory under the given roots, roots included."""
+    return [Path(dirpath) for directory in directories for dirpath, _, _ in os.walk(directory)]
+
+
+class InotifyWatcher:
+    """Kernel-backed watcher (Linux only)."""
+
+    def __init__(self, directories, recursive=False):
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.recursive = recursive
+        self.mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_DELETE | (IN_CREATE if recursive else 0)
+        self.dirs = {}
+        try:
+            for directory in walk_directories(directories) if recursive else directories:
+                self._add_watch(directory)
+        except OSError:
+            os.close(self.fd)
+            raise
+
+    def _add_watch(self, directory):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), self.mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f'inotify_add_watch failed for {directory}')
+        self.dirs[wd] = Path(directory)
+
+    def _add_tree(self, directory):
+        """Watch a directory that appeared after startup; return PNGs already in it."""
+        found = set()
+        for subdir in walk_directories([directory]):
+            try:
+                self._add_watch(subdir)
+            except OSError:
+                # Removed again before we got to it
+                continue
+            found |= {path for path in subdir.iterdir() if path.is_file() and is_watched_file(path)}
+        return found
+
+    def wait(self, timeout):
+        """Block up to timeout seconds (None = forever); return changed paths."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed = set()
+        data = os.read(self.fd, 64 * 1024)
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            if mask & IN_IGNORED:
+                # Watched directory was deleted
+                self.dirs.pop(wd, None)
+            elif wd in self.dirs and name:
+                path = self.dirs[wd] / os.fsdecode(name)
+                if mask & IN_ISDIR:
+                    if self.recursive and mask & (IN_CREATE | IN_MOVED_TO):
+                        # Files can land before the watch exists, so report what's there
+                        changed |= self._add_tree(path)
+                elif is_watched_file(path):
+                    changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Portable fallback that diffs (mtime, size) snapshots."""
+
+    def __init__(self, directories, interval=POLL_INTERVAL, recursive=False):
+        self.directories = [Path(d) for d in directories]
+        self.interval = interval
+        # Recursive scans re-walk the tree every poll, so new subdirectories are picked up
+        self.pattern = '**/*' if recursive else '*'
+        self.snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for directory in self.directories:
+            for path in directory.glob(self.pattern):
+                if not is_watched_file(path):
+                    continue
+                try:
+                    st = path.stat()
+                except FileNotFoundError:
+                    continue
+                snapshot[path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def wait(self, timeout):
+        time.sleep(self.interval if timeout is None else min(self.interval, timeout))
+        current = self._scan()
+        changed = {p for p, sig in current.items() if self.snapshot.get(p) != sig}
+        changed |= self.snapshot.keys() - current.keys()
+        self.snapshot = current
+        return changed
+
+    def close(self):
+        pass
+
+
+def open_watcher(directories, recursive=False):
+    """Prefer inotify, fall back to polling."""
+    try:
+        watcher = InotifyWatcher(directories, recursive=recursive)
+        print("👀 Watching with inotify")
+    except (OSError, AttributeError, TypeError):
+        watcher = PollingWatcher(directories, recursive=recursive)
+        print(f"👀 Watching by polling every {POLL_INTERVAL}s")
+    return watcher
+
+
+def watch(directories, on_change, debounce=DEBOUNCE_SECONDS, recursive=False):
+    """Call on_change(set_of_paths) after each debounced burst of changes.
+
+    recursive=True watches every directory under the given ones, including
+    ones created while watching.
+    """
+    if len(directories) <= 3:
+        for directory in directories:
+            print(f"   {directory}")
+    else:
+        print(f"   {len(directories)} directories")
+    watcher = open_watcher(directories, recursive=recursive)
+    pending = set()
+    deadline = None
+    try:
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            changed = watcher.wait(timeout)
+            if changed:
+                pending |= changed
+                deadline = time.monotonic() + debounce
+            elif deadline is not None and time.monotonic() >= deadline:
+                batch, pending, deadline = pending, set(), None
+                started = time.perf_counter()
+                try:
+                    on_change(batch)
+                except Exception as e:
+                    # Half-exported or broken sources are normal mid-edit; wait for the next save
+                    print(f"❌ Rebuild failed: {type(e).__name__}: {e}")
+                    continue
+                print(f"⚡ Handled in {(time.perf_counter() - started) * 1000:.0f} ms")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        watcher.close()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Output helpers shared by the Claw World asset tools.
+
+Writes go to a hidden temp file next to the destination and are moved into
+place with os.replace(), so a running serve.py never hands out a
+half-written PNG.
+
+Unchanged outputs are left alone: if the destination already holds the same
+bytes (or, for images, the same pixels) nothing is written and its mtime is
+kept, so browser caches, asset_watch and deploys don't see no-op rebuilds.
+Pure duplicates are copied or hardlinked instead of decoded and re-encoded.
+"""
+
+import filecmp
+import io
+import os
+import shutil
+import stat
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+from PIL import Image
+
+# Running totals for the current process: "written" / "unchanged"
+STATS = Counter()
+
+
+def _output_mode(path):
+    """Permission bits for path: keep the existing file's, else 0666 minus umask."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _replace_atomic(path, fill):
+    """Create a temp file next to path, let fill(tmp_name) populate it, rename over path."""
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.stem}.", suffix=path.suffix, dir=path.parent)
+    os.close(fd)
+    try:
+        # mkstemp creates 0600; give the result the mode a plain open() would
+        os.chmod(tmp_name, _output_mode(path))
+        fill(tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def _write_atomic(path, data):
+    def fill(tmp_name):
+        with open(tmp_name, 'wb') as f:
+            f.write(data)
+
+    _replace_atomic(path, fill)
+
+
+def _record(written):
+    STATS["written" if written else "unchanged"] += 1
+    return written
+
+
+def same_bytes(path, data):
+    """True if path exists and already contains exactly data."""
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, 'rb') as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def same_pixels(path, img):
+    """True if path is an image with the same size, mode and pixels as img."""
+    try:
+        with Image.open(path) as existing:
+            return (existing.size == img.size and existing.mode == img.mode
+                    and existing.getpalette() == img.getpalette()
+                    and existing.tobytes() == img.tobytes())
+    except (OSError, ValueError):
+        return False
+
+
+def write_bytes_atomic(path, data):
+    """Write bytes to path via temp file + rename, unless already identical.
+
+    Returns True if the file was written.
+    """
+    if same_bytes(path, data):
+        return _record(False)
+    _write_atomic(path, data)
+    return _record(True)
+
+
+def save_atomic(img, path):
+    """Save a PIL image to path as PNG via temp file + rename.
+
+    Skipped when the existing file has the same encoded bytes or decodes to
+    the same pixels (so a different PNG encoder alone doesn't cause a rewrite).
+    Returns True if the file was written.
+    """
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG')
+    data = buffer.getvalue()
+    if same_bytes(path, data) or same_pixels(path, img):
+        return _record(False)
+    _write_atomic(path, data)
+    return _record(True)
+
+
+def copy_atomic(src, dst, link=False):
+    """Duplicate src to dst without decoding it, unless dst already matches.
+
+    With link=True dst becomes a hardlink to src where the filesystem allows
+    it (falls back to a copy). That is safe because every writer here
+    replaces files by rename, which breaks the link instead of editing both.
+    Returns True if dst was (re)created.
+    """
+    src, dst = Path(src), Path(dst)
+    try:
+        if os.path.samefile(src, dst) or filecmp.cmp(src, dst, shallow=False):
+            return _record(False)
+    except OSError:
+        pass
+
+    def fill(tmp_name):
+        if link:
+            try:
+                os.unlink(tmp_name)
+                os.link(src, tmp_name)
+                return
+            except OSError:
+                pass
+        shutil.copyfile(src, tmp_name)
+
+    _replace_atomic(dst, fill)
+    return _record(True)
+
+
+def summary():
+    """One-line report of this run's writes, e.g. '12 written, 40 unchanged'."""
+    return f"{STATS['written']} written, {STATS['unchanged']} unchanged"
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Bake the Claw World ground and path tile layers offline.
+
+Resolves every cell of the editor map (client/js/data/EditorMapData.js) to its
+final PixelLab tile index, the same way AutoTiler.js and PathAutoTiler.js do
+at boot: corners are "upper" if any touching cell is land/path, the four
+corners give a Wang index (NE=1, SE=2, SW=4, NW=8), and the index is mapped to
+a PNG position through a lookup table read from each tileset's metadata.
+
+Output: client/js/data/BakedTileData.js, loaded by game.html and applied by
+BakedTileLayers.js. The client still falls back to the JS autotilers when the
+map no longer matches what was baked.
+
+Use --check to run the JS autotilers through node and diff the results.
+"""
+
+import argparse
+import base64
+import json
+import subprocess
+from pathlib import Path
+
+import numpy as np
+
+from asset_writer import write_bytes_atomic
+
+CLIENT_DIR = Path(__file__).parent.parent / "client"
+TILES_DIR = CLIENT_DIR / "assets/sprites/tiles"
+MAP_DATA_PATH = CLIENT_DIR / "js/data/EditorMapData.js"
+OUTPUT_PATH = CLIENT_DIR / "js/data/BakedTileData.js"
+
+TILE_SIZE = 16
+WATER = 1
+
+# Tileset key -> Wang metadata (the PNGs Game.js loads for these keys)
+TILESET_METADATA = {
+    "main": "pixellab_sand_water_metadata.json",
+    "path": "pixellab_sand_cobblestone_metadata.json",
+    "dark_path": "dark_cobblestone_metadata.json"
+}
+
+# Decoration type -> path tileset; later entries overwrite earlier ones
+PATH_TILESETS = {
+    "dirt_path": "path",
+    "cobblestone_path": "dark_path"
+}
+
+WANG_BITS = {"NE": 1, "SE": 2, "SW": 4, "NW": 8}
+
+
+def load_map_data(path=MAP_DATA_PATH):
+    """Read the EDITOR_MAP_DATA object literal (it is plain JSON)."""
+    text = path.read_text(encoding='utf-8')
+    start = text.index('{')
+    end = text.index('\n};', start)
+    return json.loads(text[start:end + 2])
+
+
+def wang_lut(metadata_name):
+    """Wang index -> PNG position, from a PixelLab tileset metadata file.
+
+    Newer exports carry each tile's bounding_box; older ones only list tiles
+    in sheet order (4 columns, as extract_sprites.py lays them out).
+    """
+    with open(TILES_DIR / metadata_name) as f:
+        metadata = json.load(f)
+    tileset = metadata.get("tileset_data") or metadata["tileset"]
+    columns = 4
+
+    lut = np.full(16, -1, np.int16)
+    for i, tile in enumerate(tileset["tiles"]):
+        wang = sum(bit for corner, bit in WANG_BITS.items() if tile["corners"][corner] == "upper")
+        box = tile.get("bounding_box")
+        if box:
+            size = tileset.get("tile_size", {}).get("width", TILE_SIZE)
+            lut[wang] = (box["y"] // size) * columns + box["x"] // size
+        else:
+            lut[wang] = i
+    if (lut < 0).any():
+        raise ValueError(f"{metadata_name} is missing Wang tiles {np.nonzero(lut < 0)[0].tolist()}")
+    return lut
+
+
+def padded(mask_positions, width, height):
+    """Boolean (height+2, width+2) grid with a one-cell out-of-bounds border."""
+    grid = np.zeros((height + 2, width + 2), bool)
+    for col, row in mask_positions:
+        if -1 <= col <= width and -1 <= row <= height:
+            grid[row + 1, col + 1] = True
+    return grid
+
+
+def wang_indices(upper):
+    """Per-cell Wang index from a padded upper-terrain grid."""
+    corners = upper[:-1, :-1] | upper[:-1, 1:] | upper[1:, :-1] | upper[1:, 1:]
+    nw = corners[:-1, :-1]
+    ne = corners[:-1, 1:]
+    sw = corners[1:, :-1]
+    se = corners[1:, 1:]
+    return ne * 1 + se * 2 + sw * 4 + nw * 8
+
+
+def bake_ground(terrain, lut):
+    """Tile ids for the sand/water ground layer (AutoTiler.autoTileLayer)."""
+    height, width = terrain.shape
+    upper = np.zeros((height + 2, width + 2), bool)
+    upper[1:-1, 1:-1] = terrain != WATER
+    return lut[wang_indices(upper)].astype(np.uint8)
+
+
+def bake_paths(positions, width, height, luts):
+    """Encoded path layer: 0 = empty, else tileset_index * 16 + tile_id + 1.
+
+    Mirrors Game.buildPathTileLayer: corners use every path type so different
+    paths meet without sand gaps, each type only draws within one cell of its
+    own positions, and later types overwrite earlier ones.
+    """
+    all_upper = padded(set().union(*positions.values()), width, height)
+    wang = wang_indices(all_upper)
+
+    layer = np.zeros((height, width), np.uint8)
+    for index, (tileset, cells) in enumerate(positions.items()):
+        own = padded(cells, width, height)
+        near = np.zeros((height, width), bool)
+        for dr in range(3):
+            for dc in range(3):
+                near |= own[dr:dr + height, dc:dc + width]
+        draw = near & (wang != 0)
+        layer[draw] = index * 16 + luts[tileset][wang[draw]] + 1
+    return layer
+
+
+def path_positions(map_data):
+    """{tileset: {(col, row)}} from editor path decorations."""
+    positions = {tileset: set() for tileset in PATH_TILESETS.values()}
+    for item in (map_data.get("decorations") or []) + (map_data.get("editorPlaced") or []):
+        if not isinstance(item, dict) or item.get("type") not in PATH_TILESETS:
+            continue
+        x = item["x"] if isinstance(item.get("x"), (int, float)) else 0
+        y = item["y"] if isinstance(item.get("y"), (int, float)) else 0
+        positions[PATH_TILESETS[item["type"]]].add((int(x // TILE_SIZE), int(y // TILE_SIZE)))
+    return positions
+
+
+def encode(array):
+    return base64.b64encode(np.ascontiguousarray(array).tobytes()).decode('ascii')
+
+
+def encode_mask(positions, width, height):
+    """Packed bitmask of in-bounds positions (lets the client detect stale data)."""
+    mask = padded(positions, width, height)[1:-1, 1:-1]
+    return encode(np.packbits(mask.ravel()))
+
+
+def run_js_autotilers(map_data_path=MAP_DATA_PATH):
+    """Run AutoTiler.js/PathAutoTiler.js on the editor map via node."""
+    script = """
+const fs = require('fs');
+const vm = require('vm');
+const [mapPath, tileSize, pathTypes] = process.argv.slice(1);
+const read = (p) => fs.readFileSync(p, 'utf8');
+vm.runInThisContext(read('js/world/AutoTiler.js') + read('js/world/PathAutoTiler.js') + read(mapPath)
+    + '\\nglobalThis.__tilers = { AutoTiler, PathAutoTiler, EDITOR_MAP_DATA };');
+const { EDITOR_MAP_DATA: data, ...tilers } = globalThis.__tilers;
+const w = data.terrainWidth || 200, h = data.terrainHeight || 200, size = Number(tileSize);
+const grid = [];
+for (let r = 0; r < h; r++) grid.push(data.terrainMap.slice(r * w, r * w + w));
+const ground = new tilers.AutoTiler().autoTileLayer(grid, w, h).flat();
+
+const types = JSON.parse(pathTypes);
+const tilesets = [...new Set(Object.values(types))];
+const sets = Object.fromEntries(tilesets.map(t => [t, new Set()]));
+for (const d of [...(data.decorations || []), ...(data.editorPlaced || [])]) {
+    if (!d || !(d.type in types)) continue;
+    const x = typeof d.x === 'number' ? d.x : 0, y = typeof d.y === 'number' ? d.y : 0;
+    sets[types[d.type]].add(`${Math.floor(x / size)},${Math.floor(y / size)}`);
+}
+const all = new Set(tilesets.flatMap(t => [...sets[t]]));
+const paths = new Array(w * h).fill(0);
+const tiler = new tilers.PathAutoTiler();
+tilesets.forEach((t, index) => {
+    if (sets[t].size === 0) return;
+    tiler.buildPathLayer(sets[t], w, h, t, all).flat().forEach((cell, i) => {
+        if (cell) paths[i] = index * 16 + cell.id + 1;
+    });
+});
+process.stdout.write(JSON.stringify({ ground, paths }));
+"""
+    result = subprocess.run(
+        ["node", "-e", script, str(Path(map_data_path).resolve()), str(TILE_SIZE), json.dumps(PATH_TILESETS)],
+        cwd=CLIENT_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"node autotiler run failed:\n{result.stderr}")
+    return json.loads(result.stdout)
+
+
+def check(ground, paths):
+    """Diff the baked layers against the JS autotilers; True if identical."""
+    js = run_js_autotilers()
+    ok = True
+    for name, baked in (("ground", ground), ("paths", paths)):
+        expected = np.array(js[name], np.int16).reshape(baked.shape)
+        diff = np.argwhere(expected != baked)
+        if len(diff):
+            ok = False
+            row, col = diff[0]
+            print(f"  ❌ {name}: {len(diff)} cells differ (first at {col},{row}: "
+                  f"baked {baked[row, col]}, JS {expected[row, col]})")
+        else:
+            print(f"  ✅ {name}: identical to JS ({baked.size} cells)")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake autotiled ground/path layers for the editor map.")
+    parser.add_argument("--check", action="store_true", help="diff the result against the JS autotilers (needs node)")
+    args = parser.parse_args()
+
+    print("🧱 Baking Claw World autotile layers...")
+    map_data = load_map_data()
+    width = map_data.get("terrainWidth") or 200
+    height = map_data.get("terrainHeight") or 200
+    terrain = np.asarray(map_data["terrainMap"], np.uint8).reshape(height, width)
+    print(f"Map: {width}x{height}")
+
+    luts = {key: wang_lut(name) for key, name in TILESET_METADATA.items()}
+    ground = bake_ground(terrain, luts["main"])
+
+    positions = path_positions(map_data)
+    paths = bake_paths(positions, width, height, luts)
+    for tileset, cells in positions.items():
+        print(f"  🛤️  {tileset}: {len(cells)} positions")
+
+    data = {
+        "width": width,
+        "height": height,
+        "ground": encode(ground),
+        "groundMask": encode_mask(zip(*np.nonzero(terrain != WATER)[::-1]), width, height),
+        "pathTilesets": list(positions),
+        "pathCounts": {tileset: len(cells) for tileset, cells in positions.items()},
+        "pathMasks": {tileset: encode_mask(cells, width, height) for tileset, cells in positions.items()},
+        "paths": encode(paths)
+    }
+    source = (
+        "// Generated by tools/bake_autotiles.py from EditorMapData.js — do not edit.\n"
+        f"const BAKED_TILE_DATA = {json.dumps(data, indent=2)};\n\n"
+        "if (typeof module !== 'undefined') {\n"
+        "  module.exports = BAKED_TILE_DATA;\n"
+        "}\n"
+    )
+    if write_bytes_atomic(OUTPUT_PATH, source.encode('utf-8')):
+        print(f"  💾 Saved {OUTPUT_PATH} ({len(source) // 1024} KB)")
+    else:
+        print(f"  💾 {OUTPUT_PATH} unchanged")
+
+    if args.check:
+        print()
+        print("🔍 Checking against JS autotilers...")
+        if not check(ground, paths):
+            raise SystemExit(1)
+
+    print()
+    print("✅ Done!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Bake navigation data for server-side bots.
+
+Asks node for the world the server builds at boot (server/terrainMap.js) and
+which bot positions server/serverCollisionSystem.js accepts, then
+precomputes everything a bot needs to path without trial-and-error moves:
+
+- walkability grid: cell (col, row) = a bot standing at (col*16, row*16)
+- connected components (4-neighbour, matching 16px north/south/east/west steps)
+- chunk-level graph: walkable regions per CHUNK_SIZE chunk and their links
+- distance + flow fields to points of interest (building doors, islands)
+
+Output: server/data/navgrid.bin, read by server/navGrid.js. The file is an
+8-byte magic, a little-endian uint32 header length, a JSON header describing
+the arrays, then the zlib-compressed little-endian arrays themselves.
+
+Re-run after editing the map (EditorMapData.js) or collision definitions.
+"""
+
+import argparse
+import json
+import struct
+import subprocess
+import zlib
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+
+from asset_writer import write_bytes_atomic
+
+ROOT = Path(__file__).parent.parent
+OUTPUT_PATH = ROOT / "server/data/navgrid.bin"
+
+MAGIC = b"CLAWNAV1"
+CHUNK_SIZE = 16
+UNREACHABLE = 0xFFFF
+
+# Flow directions, in the order ties are broken (0 = stay / unreachable)
+DIRECTIONS = {
+    1: ("north", -1, 0),
+    2: ("east", 0, 1),
+    3: ("south", 1, 0),
+    4: ("west", 0, -1)
+}
+
+EXPORT_SCRIPT = """
+const { generateTerrain, generateBuildings, TILE_SIZE } = require('./server/terrainMap');
+const { ServerCollisionSystem, getCharacterCollisionBox } = require('./server/serverCollisionSystem');
+console.log = console.warn = () => {};
+
+const terrain = generateTerrain();
+const buildings = generateBuildings(terrain);
+const collision = new ServerCollisionSystem(terrain);
+collision.setBuildings(buildings);
+collision.setDecorations(terrain.decorations || []);
+
+const walkable = [];
+for (let row = 0; row < terrain.height; row++) {
+    for (let col = 0; col < terrain.width; col++) {
+        const box = getCharacterCollisionBox(col * TILE_SIZE, row * TILE_SIZE);
+        walkable.push(collision.checkCollision(box.x, box.y, box.width, box.height) ? 0 : 1);
+    }
+}
+
+const doorOf = (b) => b.getDoorBounds ? b.getDoorBounds() : {
+    x: b.x + collision.getBuildingDoorOffsetX(b.type, b.width, collision.getBuildingDoorWidth(b.type)),
+    width: collision.getBuildingDoorWidth(b.type)
+};
+process.stdout.write(JSON.stringify({
+    width: terrain.width,
+    height: terrain.height,
+    tileSize: TILE_SIZE,
+    walkable,
+    buildings: buildings.map(b => ({
+        name: b.name, type: b.type, x: b.x, y: b.y, width: b.width, height: b.height, door: doorOf(b)
+    })),
+    islands: terrain.islands.map(i => ({ x: i.x, y: i.y, size: i.size }))
+}));
+"""
+
+
+def export_world():
+    """Walkability and points of interest as the server computes them."""
+    result = subprocess.run(["node", "-e", EXPORT_SCRIPT], cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"node world export failed:\n{result.stderr}")
+    return json.loads(result.stdout)
+
+
+def label(walkable, chunk_size=None):
+    """4-connected labels (0 = blocked, 1..n); optionally cut at chunk borders."""
+    height, width = walkable.shape
+    labels = np.zeros((height, width), np.int32)
+    count = 0
+    for start_row, start_col in zip(*np.nonzero(walkable)):
+        if labels[start_row, start_col]:
+            continue
+        count += 1
+        labels[start_row, start_col] = count
+        queue = deque([(start_row, start_col)])
+        while queue:
+            row, col = queue.popleft()
+            for _, dr, dc in DIRECTIONS.values():
+                r, c = row + dr, col + dc
+                if not (0 <= r < height and 0 <= c < width) or labels[r, c] or not walkable[r, c]:
+                    continue
+                if chunk_size and (r // chunk_size != row // chunk_size or c // chunk_size != col // chunk_size):
+                    continue
+                labels[r, c] = count
+                queue.append((r, c))
+    return labels, count
+
+
+def shifted(grid, dr, dc, fill):
+    """grid[row + dr, col + dc] for every cell, with fill outside the map."""
+    height, width = grid.shape
+    out = np.full_like(grid, fill)
+    out[max(0, -dr):height - max(0, dr), max(0, -dc):width - max(0, dc)] = \
+        grid[max(0, dr):height + min(0, dr), max(0, dc):width + min(0, dc)]
+    return out
+
+
+def distance_field(walkable, target):
+    """Steps from every cell to target by breadth-first wavefront."""
+    dist = np.full(walkable.shape, UNREACHABLE, np.uint16)
+    frontier = np.zeros(walkable.shape, bool)
+    frontier[target] = True
+    step = 0
+    while frontier.any():
+        dist[frontier] = step
+        step += 1
+        grown = np.zeros_like(frontier)
+        for _, dr, dc in DIRECTIONS.values():
+            grown |= shifted(frontier, dr, dc, False)
+        frontier = grown & walkable & (dist == UNREACHABLE)
+    return dist
+
+
+def flow_field(dist):
+    """Direction code per cell that steps one closer to the target."""
+    flow = np.zeros(dist.shape, np.uint8)
+    reachable = (dist != UNREACHABLE) & (dist != 0)
+    for code, (_, dr, dc) in DIRECTIONS.items():
+        downhill = reachable & (flow == 0) & (shifted(dist, dr, dc, UNREACHABLE).astype(np.int32) == dist.astype(np.int32) - 1)
+        flow[downhill] = code
+    return flow
+
+
+def nearest_walkable(walkable, col, row):
+    """Closest walkable cell to (col, row), or None."""
+    rows, cols = np.nonzero(walkable)
+    if not len(rows):
+        return None
+    i = np.argmin((rows - row) ** 2 + (cols - col) ** 2)
+    return int(cols[i]), int(rows[i])
+
+
+def points_of_interest(world, walkable, extra):
+    """Named target cells: a spot in front of each door, then island centres."""
+    tile = world["tileSize"]
+    pois = []
+    for building in world["buildings"]:
+        door = building["door"]
+        col = int((door["x"] + door["width"] / 2 - tile / 2) // tile)
+        row = int(-(-(building["y"] + building["height"] - 12) // tile))
+        pois.append(("door", building["name"], col, row))
+    for i, island in enumerate(world["islands"]):
+        pois.append(("island", f"island_{i}", island["x"], island["y"]))
+    for name, col, row in extra:
+        pois.append(("custom", name, col, row))
+
+    resolved = []
+    seen = set()
+    for kind, name, col, row in pois:
+        cell = nearest_walkable(walkable, col, row)
+        if cell is None or name in seen:
+            continue
+        seen.add(name)
+        resolved.append({"kind": kind, "name": name, "col": cell[0], "row": cell[1]})
+    return resolved
+
+
+def chunk_graph(walkable, regions, region_count, components):
+    """Per-region chunk/representative cell/component plus CSR adjacency."""
+    height, width = walkable.shape
+    chunks_wide = -(-width // CHUNK_SIZE)
+    region_chunk = np.zeros(region_count, np.uint16)
+    region_cell = np.zeros(region_count, np.uint32)
+    region_component = np.zeros(region_count, np.uint16)
+
+    rows, cols = np.nonzero(regions)
+    ids = regions[rows, cols] - 1
+    counts = np.bincount(ids, minlength=region_count)
+    mean_row = np.bincount(ids, rows, region_count) / counts
+    mean_col = np.bincount(ids, cols, region_count) / counts
+    # Representative = member cell nearest the region's centroid
+    spread = (rows - mean_row[ids]) ** 2 + (cols - mean_col[ids]) ** 2
+    order = np.lexsort((spread, ids))
+    first = order[np.searchsorted(ids[order], np.arange(region_count))]
+    rep_rows, rep_cols = rows[first], cols[first]
+    region_cell[:] = rep_rows * width + rep_cols
+    region_chunk[:] = (rep_rows // CHUNK_SIZE) * chunks_wide + rep_cols // CHUNK_SIZE
+    region_component[:] = components[rep_rows, rep_cols]
+
+    # Links where walkable cells touch across a chunk border
+    pairs = []
+    for dr, dc in ((0, 1), (1, 0)):
+        neighbour = shifted(regions, dr, dc, 0)
+        linked = (regions > 0) & (neighbour > 0) & (regions != neighbour)
+        a, b = regions[linked] - 1, neighbour[linked] - 1
+        pairs.append(np.stack([a, b], 1))
+        pairs.append(np.stack([b, a], 1))
+    pairs = np.unique(np.concatenate(pairs), axis=0)
+
+    offsets = np.zeros(region_count + 1, np.uint32)
+    np.add.at(offsets, pairs[:, 0] + 1, 1)
+    offsets = np.cumsum(offsets).astype(np.uint32)
+    edges = pairs[:, 1].astype(np.uint16)
+    # Cost = Manhattan distance between representatives (an A* lower bound)
+    costs = (np.abs(rep_rows[pairs[:, 0]] - rep_rows[pairs[:, 1]]) +
+             np.abs(rep_cols[pairs[:, 0]] - rep_cols[pairs[:, 1]])).astype(np.uint16)
+    return {
+        "regionChunk": region_chunk,
+        "regionCell": region_cell,
+        "regionComponent": region_component,
+        "regionEdgeOffsets": offsets,
+        "regionEdges": edges,
+        "regionEdgeCosts": costs
+    }
+
+
+def pack(header, arrays):
+    """Serialize arrays (8-byte aligned) after a JSON header."""
+    payload = bytearray()
+    header["arrays"] = {}
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder('<'))
+        payload += b"\0" * (-len(payload) % 8)
+        header["arrays"][name] = {"dtype": array.dtype.name, "shape": list(array.shape), "offset": len(payload)}
+        payload += array.tobytes()
+    header["payloadSize"] = len(payload)
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    return MAGIC + struct.pack('<I', len(header_bytes)) + header_bytes + zlib.compress(bytes(payload), 9)
+
+
+def parse_poi(value):
+    name, _, position = value.partition('=')
+    col, _, row = position.partition(',')
+    try:
+        return name, int(col), int(row)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected NAME=COL,ROW, got {value!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake navigation grid, chunk graph and flow fields for bots.")
+    parser.add_argument("--poi", action="append", type=parse_poi, default=[], metavar="NAME=COL,ROW",
+                        help="extra point of interest in tile coordinates (repeatable)")
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH, help=f"output file (default: {OUTPUT_PATH})")
+    args = parser.parse_args()
+
+    print("🧭 Baking Claw World navigation data...")
+    world = export_world()
+    width, height = world["width"], world["height"]
+    walkable = np.asarray(world["walkable"], np.uint8).reshape(height, width).astype(bool)
+    print(f"Map: {width}x{height}, {int(walkable.sum())} walkable cells")
+
+    components, component_count = label(walkable)
+    sizes = np.bincount(components.ravel())[1:]
+    print(f"  🏝️  {component_count} components (largest {int(sizes.max()) if len(sizes) else 0} cells)")
+
+    regions, region_count = label(walkable, CHUNK_SIZE)
+    graph = chunk_graph(walkable, regions, region_count, components)
+    print(f"  🧩 {region_count} regions in {CHUNK_SIZE}x{CHUNK_SIZE} chunks, {len(graph['regionEdges']) // 2} links")
+
+    pois = points_of_interest(world, walkable, args.poi)
+    distances = np.zeros((len(pois), height, width), np.uint16)
+    flows = np.zeros((len(pois), height, width), np.uint8)
+    for i, poi in enumerate(pois):
+        distances[i] = distance_field(walkable, (poi["row"], poi["col"]))
+        flows[i] = flow_field(distances[i])
+    print(f"  📍 {len(pois)} points of interest")
+
+    header = {
+        "version": 1,
+        "width": width,
+        "height": height,
+        "tileSize": world["tileSize"],
+        "chunkSize": CHUNK_SIZE,
+        "componentCount": component_count,
+        "regionCount": region_count,
+        "unreachable": UNREACHABLE,
+        "directions": {str(code): name for code, (name, _, _) in DIRECTIONS.items()},
+        "pois": pois
+    }
+    arrays = {
+        "walkable": walkable.astype(np.uint8),
+        "components": components.astype(np.uint16),
+        "regions": regions.astype(np.uint16),
+        **graph,
+        "distances": distances,
+        "flows": flows
+    }
+    data = pack(header, arrays)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    if write_bytes_atomic(args.output, data):
+        print(f"  💾 Saved {args.output} ({len(data) // 1024} KB)")
+    else:
+        print(f"  💾 {args.output} unchanged")
+
+    print()
+    print("✅ Done!")
+
+
+if __name__ == "__main__":
+    main()
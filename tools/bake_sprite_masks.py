@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Derive collision footprints and occlusion masks from decoration/building art.
+
+For every decoration PNG and every building base sprite the game draws:
+- bounds: tight box of visible pixels (same alpha threshold as
+  find_content_bounds in process_character_sprites.py)
+- footprint: tight box of the visible pixels in the bottom part of that box,
+  i.e. where the object meets the ground
+- mask (optional): low-res bitmask of cells that are fully opaque, so the
+  renderer can tell when a sprite completely covers what is behind it
+
+Boxes are [x, y, width, height] in sprite pixels. Decoration types from
+DecorationLoader.DECORATIONS also get the footprint scaled to their display
+size as {width, height, offsetX, offsetY}: under `collision` for types that
+already have a hand-made collision rect (same shape, drop-in), and under
+`footprint` for walkable types (paths, bridges, shells...), which must stay
+non-solid.
+
+Output: client/js/data/SpriteMasks.js (SPRITE_MASKS, also module.exports for
+the server). Use --compare to list derived vs hand-maintained collision rects.
+"""
+
+import argparse
+import base64
+import json
+import subprocess
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from asset_writer import write_bytes_atomic
+from process_character_sprites import find_content_bounds
+
+ROOT_DIR = Path(__file__).parent.parent
+CLIENT_DIR = ROOT_DIR / "client"
+SPRITES_DIR = CLIENT_DIR / "assets/sprites"
+OUTPUT_PATH = CLIENT_DIR / "js/data/SpriteMasks.js"
+
+ALPHA_THRESHOLD = 64
+
+# Sprites analysed per category (building drafts like *_dalle_* are never drawn)
+SPRITE_PATTERNS = {
+    "decorations": "*.png",
+    "buildings": "*_base.png"
+}
+
+# Share of the visible height (from the bottom) that counts as footprint
+FOOTPRINT_FRACTION = {
+    "decorations": 0.25,
+    "buildings": 0.6
+}
+MIN_FOOTPRINT_HEIGHT = 2
+
+# Occlusion mask cell size in pixels; a cell is set only if every pixel is opaque
+MASK_CELL = 8
+OPAQUE_ALPHA = 250
+
+
+def box(bounds):
+    """(xmin, ymin, xmax, ymax) -> [x, y, width, height]"""
+    xmin, ymin, xmax, ymax = bounds
+    return [xmin, ymin, xmax - xmin, ymax - ymin]
+
+
+def footprint(rgba, bounds, fraction):
+    """Tight box of the visible pixels in the bottom `fraction` of bounds."""
+    xmin, ymin, xmax, ymax = bounds
+    height = max(MIN_FOOTPRINT_HEIGHT, int(round((ymax - ymin) * fraction)))
+    top = max(ymin, ymax - height)
+    band = find_content_bounds(rgba[top:ymax], ALPHA_THRESHOLD)
+    if band is None:
+        return None
+    bx0, by0, bx1, by1 = band
+    return [bx0, top + by0, bx1 - bx0, by1 - by0]
+
+
+def occlusion_mask(alpha):
+    """Packed bits (row-major, MASK_CELL cells) of fully opaque cells, or None."""
+    rows = -(-alpha.shape[0] // MASK_CELL)
+    cols = -(-alpha.shape[1] // MASK_CELL)
+    padded = np.zeros((rows * MASK_CELL, cols * MASK_CELL), bool)
+    padded[:alpha.shape[0], :alpha.shape[1]] = alpha >= OPAQUE_ALPHA
+    cells = padded.reshape(rows, MASK_CELL, cols, MASK_CELL).all(axis=(1, 3))
+    if not cells.any():
+        return None
+    return base64.b64encode(np.packbits(cells.ravel()).tobytes()).decode('ascii')
+
+
+def analyze(path, category, masks=True):
+    """Table entry for one sprite (None if unreadable or fully transparent)."""
+    try:
+        with Image.open(path) as img:
+            rgba = np.asarray(img.convert('RGBA'))
+    except OSError:
+        print(f"  ⚠️  Unreadable: {path.name}")
+        return None
+    bounds = find_content_bounds(rgba, ALPHA_THRESHOLD)
+    if bounds is None:
+        return None
+
+    entry = {
+        "size": [rgba.shape[1], rgba.shape[0]],
+        "bounds": box(bounds),
+        "footprint": footprint(rgba, bounds, FOOTPRINT_FRACTION[category])
+    }
+    if masks:
+        mask = occlusion_mask(rgba[:, :, 3])
+        if mask:
+            entry["mask"] = mask
+    return entry
+
+
+def load_decoration_types():
+    """DecorationLoader.DECORATIONS via node (it's a JS class static)."""
+    result = subprocess.run(
+        ["node", "-e", "process.stdout.write(JSON.stringify("
+                       "require('./client/js/core/DecorationLoader.js').DECORATIONS))"],
+        cwd=ROOT_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"node could not load DecorationLoader.js:\n{result.stderr}")
+    return json.loads(result.stdout)
+
+
+def type_footprint(entry, definition):
+    """Footprint scaled to the decoration's display size, as a collision-style rect."""
+    x, y, w, h = entry["footprint"]
+    sx = definition.get("width", entry["size"][0]) / entry["size"][0]
+    sy = definition.get("height", entry["size"][1]) / entry["size"][1]
+    return {
+        "width": max(1, round(w * sx)),
+        "height": max(1, round(h * sy)),
+        "offsetX": round(x * sx),
+        "offsetY": round(y * sy)
+    }
+
+
+def compare(types, definitions):
+    """Print hand-maintained vs derived collision rects for solid decorations."""
+    print(f"  {'type':<18} {'hand (w x h @ x,y)':<22} derived")
+    for name, definition in definitions.items():
+        hand = definition.get("collision")
+        if not hand or name not in types:
+            continue
+        derived = types[name]["collision"]
+        hand_x = hand.get("offsetX", round((definition["width"] - hand["width"]) / 2))
+        print(f"  {name:<18} {hand['width']:>3} x {hand['height']:<3} @ {hand_x},{hand['offsetY']:<8} "
+              f"{derived['width']:>3} x {derived['height']:<3} @ {derived['offsetX']},{derived['offsetY']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Derive collision footprints and occlusion masks from sprite alpha.")
+    parser.add_argument("--no-masks", action="store_true", help="skip the occlusion bitmasks")
+    parser.add_argument("--compare", action="store_true",
+                        help="print derived vs hand-maintained decoration collision rects")
+    args = parser.parse_args()
+
+    print("🧱 Baking sprite footprints and occlusion masks...")
+    sprites = {}
+    for category, pattern in SPRITE_PATTERNS.items():
+        paths = sorted((SPRITES_DIR / category).glob(pattern))
+        for path in paths:
+            entry = analyze(path, category, masks=not args.no_masks)
+            if entry:
+                sprites[path.relative_to(SPRITES_DIR).with_suffix("").as_posix()] = entry
+        print(f"  🖼️  {category}: {len(paths)} sprites")
+
+    definitions = load_decoration_types()
+    types = {}
+    for name, definition in definitions.items():
+        sprite_id = Path(definition["path"]).relative_to("assets/sprites").with_suffix("").as_posix()
+        entry = sprites.get(sprite_id)
+        if entry and entry["footprint"]:
+            # Only types that already collide get a drop-in collision rect
+            key = "collision" if definition.get("collision") else "footprint"
+            types[name] = {"sprite": sprite_id, key: type_footprint(entry, definition)}
+    print(f"  🌴 {len(types)}/{len(definitions)} decoration types mapped")
+
+    # One sprite per line keeps the file compact and diffable
+    lines = [f"    {json.dumps(key)}: {json.dumps(value, separators=(',', ':'))}" for key, value in sprites.items()]
+    type_lines = [f"    {json.dumps(key)}: {json.dumps(value, separators=(',', ':'))}" for key, value in types.items()]
+    source = (
+        "// Generated by tools/bake_sprite_masks.py from decoration/building art — do not edit.\n"
+        "const SPRITE_MASKS = {\n"
+        f"  \"alphaThreshold\": {ALPHA_THRESHOLD},\n"
+        f"  \"maskCell\": {MASK_CELL},\n"
+        "  \"sprites\": {\n" + ",\n".join(lines) + "\n  },\n"
+        "  \"types\": {\n" + ",\n".join(type_lines) + "\n  }\n"
+        "};\n\n"
+        "if (typeof module !== 'undefined') {\n"
+        "  module.exports = SPRITE_MASKS;\n"
+        "}\n"
+    )
+    if write_bytes_atomic(OUTPUT_PATH, source.encode('utf-8')):
+        print(f"  💾 Saved {OUTPUT_PATH} ({len(source) // 1024} KB)")
+    else:
+        print(f"  💾 {OUTPUT_PATH} unchanged")
+
+    if args.compare:
+        print()
+        compare(types, definitions)
+
+    print()
+    print("✅ Done!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env node
+/*
+ * Compare a baked accessory composite (tools/composite_accessories.py) pixel
+ * for pixel with what the client draws at runtime: SpriteComposer.compose for
+ * the idle frame and SpriteComposer.drawWalkFrame for the walk strip, fed the
+ * same images createCombinedSpriteSheet uses (no tint).
+ *
+ * Usage:
+ *   node tools/check_composites.js <species> <accessory>
+ *
+ * Exits 1 if any pixel differs or a baked file is missing, 2 if it can't run.
+ */
+
+const fs = require('fs');
+const path = require('path');
+let canvasModule;
+try {
+    canvasModule = require('canvas');
+} catch (e) {
+    console.error('❌ The optional `canvas` package is not installed (npm install canvas)');
+    process.exit(2);
+}
+const { createCanvas, loadImage } = canvasModule;
+
+// SpriteComposer creates its scratch canvases through document
+global.document = { createElement: () => createCanvas(1, 1) };
+const SpriteComposer = require('../client/js/character/SpriteComposer.js');
+const CONSTANTS = require('../client/js/shared/Constants.js');
+
+const CHARACTERS_DIR = path.join(__dirname, '../client/assets/sprites/characters');
+const ACCESSORIES_DIR = path.join(__dirname, '../client/assets/sprites/accessories');
+const DIRECTIONS = ['south', 'north', 'west', 'east'];
+const WALK_FRAMES = 3;
+const FRAME_WIDTH = CONSTANTS.CHARACTER_SPRITE_WIDTH;
+const FRAME_HEIGHT = CONSTANTS.CHARACTER_SPRITE_HEIGHT;
+
+const args = process.argv.slice(2);
+if (args.length < 2) {
+    console.error('Usage: node tools/check_composites.js <species> <accessory>');
+    process.exit(2);
+}
+const [species, accessory] = args;
+
+// Same as Game.js normalizeImage: nearest-scale anything not at frame size
+function normalize(image) {
+    if (image.width === FRAME_WIDTH && image.height === FRAME_HEIGHT) return image;
+    const canvas = createCanvas(FRAME_WIDTH, FRAME_HEIGHT);
+    const ctx = canvas.getContext('2d');
+    ctx.imageSmoothingEnabled = false;
+    ctx.drawImage(image, 0, 0, FRAME_WIDTH, FRAME_HEIGHT);
+    return canvas;
+}
+
+function pixels(image, sx, width, height) {
+    const canvas = createCanvas(width, height);
+    const ctx = canvas.getContext('2d');
+    ctx.drawImage(image, sx, 0, width, height, 0, 0, width, height);
+    return ctx.getImageData(0, 0, width, height).data;
+}
+
+function countDiffs(label, baked, runtime, sx, width, height) {
+    const a = pixels(baked, 0, width, height);
+    const b = pixels(runtime, sx, width, height);
+    let diffs = 0;
+    for (let i = 0; i < a.length; i += 4) {
+        if (a[i] !== b[i] || a[i + 1] !== b[i + 1] || a[i + 2] !== b[i + 2] || a[i + 3] !== b[i + 3]) {
+            if (diffs === 0) {
+                const x = (i / 4) % width;
+                const y = Math.floor(i / 4 / width);
+                console.log(`  ❌ ${label}: first difference at (${x}, ${y}): baked ${[...a.slice(i, i + 4)]} vs runtime ${[...b.slice(i, i + 4)]}`);
+            }
+            diffs++;
+        }
+    }
+    return diffs;
+}
+
+async function main() {
+    const speciesDir = path.join(CHARACTERS_DIR, species);
+    const compositesDir = path.join(speciesDir, 'composites');
+    const overlay = await loadImage(path.join(ACCESSORIES_DIR, `${accessory}.png`));
+
+    // Idle sheet exactly as createCombinedSpriteSheet composes it
+    const idleImages = {};
+    for (const dir of DIRECTIONS) {
+        idleImages[dir] = normalize(await loadImage(path.join(speciesDir, `${dir}.png`)));
+    }
+    const composer = new SpriteComposer();
+    composer.addBaseSprite('character', idleImages);
+    composer.addAccessory(accessory, { south: overlay, north: overlay, west: overlay, east: overlay });
+    const idleSheet = composer.compose({ baseSpriteKey: 'character', accessories: [accessory] });
+
+    let diffs = 0;
+    for (const [dirIndex, dir] of DIRECTIONS.entries()) {
+        const idlePath = path.join(compositesDir, `${accessory}_${dir}.png`);
+        const walkPath = path.join(compositesDir, `${accessory}_${dir}_walk.png`);
+        if (!fs.existsSync(idlePath) || !fs.existsSync(walkPath)) {
+            console.log(`  ❌ ${species} + ${accessory} ${dir}: not baked`);
+            diffs++;
+            continue;
+        }
+
+        diffs += countDiffs(`${dir} idle`, await loadImage(idlePath), idleSheet,
+            dirIndex * FRAME_WIDTH, FRAME_WIDTH, FRAME_HEIGHT);
+
+        const walkSheet = createCanvas(FRAME_WIDTH * WALK_FRAMES, FRAME_HEIGHT);
+        const ctx = walkSheet.getContext('2d');
+        ctx.imageSmoothingEnabled = false;
+        for (let frame = 0; frame < WALK_FRAMES; frame++) {
+            const img = normalize(await loadImage(path.join(speciesDir, 'frames', `${dir}_walk_${frame}.png`)));
+            composer.drawWalkFrame(ctx, img, frame * FRAME_WIDTH, FRAME_WIDTH, FRAME_HEIGHT, [overlay]);
+        }
+        diffs += countDiffs(`${dir} walk`, await loadImage(walkPath), walkSheet,
+            0, FRAME_WIDTH * WALK_FRAMES, FRAME_HEIGHT);
+    }
+
+    if (diffs > 0) {
+        console.log(`❌ ${species} + ${accessory}: ${diffs} pixel(s) differ from runtime layering`);
+        process.exit(1);
+    }
+    console.log(`✅ ${species} + ${accessory} matches runtime layering pixel for pixel`);
+}
+
+main().catch((e) => {
+    console.error(`❌ ${e.message}`);
+    process.exit(2);
+});
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Bake species x accessory composite sheets for Claw World.
+
+Combines each species' processed sprites (process_character_sprites.py)
+with the 16x16 accessory overlays (process_accessories.py), placing every
+overlay exactly where the client layers it at runtime today:
+- idle (<direction>.png): SpriteComposer.compose draws the overlay at its
+  own size on the frame's top-left corner
+- walk frames (frames/<direction>_walk_<i>.png): SpriteComposer.drawWalkFrame
+  shifts the frame down until its lowest visible row touches the bottom edge
+  and stretches the overlay over the whole frame from that same origin
+Composites are untinted (hueShift 0).
+
+Outputs:
+- characters/accessory_anchors.json: where each overlay's top-left lands
+  (and the size it's drawn at) in every idle and walk frame, so the client
+  can place any combination; walk frames are drawn at their anchor too
+- characters/<species>/composites/<accessory>_<direction>_walk.png and
+  <accessory>_<direction>.png for the combinations that get baked
+
+By default only POPULAR_COMBINATIONS are baked; use --species/--accessory
+to bake specific ones on demand, or --all for every combination. --check
+compares the first baked combination pixel for pixel against the client's
+SpriteComposer (tools/check_composites.js, needs node and `canvas`).
+"""
+
+import argparse
+import itertools
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+import process_accessories as accessories
+import process_character_sprites as characters
+from asset_writer import summary, write_bytes_atomic
+from scaled_variants import ScaledVariants, add_scales_argument
+
+ANCHORS_PATH = characters.OUTPUT_DIR / "accessory_anchors.json"
+CHECK_SCRIPT = Path(__file__).parent / "check_composites.js"
+
+# Writes composites plus any @Nx variants enabled for this category (--scales)
+VARIANTS = ScaledVariants("composites")
+
+# Body slot of each accessory (mirrors CONSTANTS.ACCESSORY_CATALOG)
+ACCESSORY_SLOTS = {
+    "baseball_cap": "head",
+    "beanie": "head",
+    "bucket_hat": "head",
+    "sunglasses": "eyes",
+    "square_glasses": "eyes",
+    "scarf": "neck",
+    "pirate_bandana": "head"
+}
+
+FRAME_SIZE = (characters.TARGET_WIDTH, characters.TARGET_HEIGHT)
+
+# Combinations baked when no species/accessory is requested explicitly
+POPULAR_COMBINATIONS = [
+    ("lobster", "baseball_cap"),
+    ("lobster", "sunglasses"),
+    ("lobster", "pirate_bandana"),
+    ("crab", "bucket_hat"),
+    ("crab", "sunglasses"),
+    ("shrimp", "beanie"),
+    ("hermit_crab", "scarf")
+]
+
+
+def canvas_resize(img, size):
+    """Nearest-neighbour resize sampling pixel centres, as drawImage does with smoothing off.
+
+    (Pillow's NEAREST picks a different source pixel on some exact half-way
+    centres, e.g. 16 -> 24.)
+    """
+    if img.size == tuple(size):
+        return img
+    (src_w, src_h), (dst_w, dst_h) = img.size, size
+    xs = (2 * np.arange(dst_w) + 1) * src_w // (2 * dst_w)
+    ys = (2 * np.arange(dst_h) + 1) * src_h // (2 * dst_h)
+    return Image.fromarray(np.asarray(img)[ys][:, xs])
+
+
+def load_frame(path):
+    """Load a sprite at frame size, scaled like the client's normalizeImage."""
+    with Image.open(path) as img:
+        return canvas_resize(img.convert('RGBA'), FRAME_SIZE)
+
+
+def load_species_frames(species):
+    """Load idle and walk sprites as {direction: (idle, [walk, ...])}."""
+    species_dir = characters.OUTPUT_DIR / species
+    frames_by_dir = {}
+    for direction in characters.DIRECTIONS:
+        idle_path = species_dir / f"{direction}.png"
+        walk_paths = [species_dir / "frames" / f"{direction}_walk_{i}.png"
+                      for i in range(characters.FRAMES_PER_DIRECTION)]
+        if not idle_path.exists() or not all(p.exists() for p in walk_paths):
+            continue
+        frames_by_dir[direction] = (load_frame(idle_path), [load_frame(p) for p in walk_paths])
+    return frames_by_dir
+
+
+def walk_offset(frame):
+    """Rows drawWalkFrame shifts a frame down by (any alpha counts, as getAlphaBounds)."""
+    rows = np.nonzero(np.asarray(frame)[:, :, 3].any(axis=1))[0]
+    if not len(rows):
+        return 0
+    return frame.height - 1 - int(rows[-1])
+
+
+def measure_anchors(idle, walk_frames):
+    """Overlay origins for one direction: {"idle": [x, y], "walk": [[x, y], ...]}."""
+    return {
+        "idle": [0, 0],
+        "walk": [[0, walk_offset(frame)] for frame in walk_frames]
+    }
+
+
+def layer(base, overlay, origin, size):
+    """Draw base, then overlay scaled to size, both at origin (like ctx.drawImage)."""
+    overlay = canvas_resize(overlay, size)
+    out = Image.new('RGBA', FRAME_SIZE, (0, 0, 0, 0))
+    out.paste(base, tuple(origin))
+    top = Image.new('RGBA', FRAME_SIZE, (0, 0, 0, 0))
+    top.paste(overlay, tuple(origin))
+    return Image.alpha_composite(out, top)
+
+
+def bake(species, accessory_id, frames_by_dir, anchors, overlay, sizes):
+    """Write composite walk strips and statics for one combination."""
+    out_dir = characters.OUTPUT_DIR / species / "composites"
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    width = characters.TARGET_WIDTH
+    for direction, (idle, walk_frames) in frames_by_dir.items():
+        strip = Image.new('RGBA', (width * len(walk_frames), characters.TARGET_HEIGHT), (0, 0, 0, 0))
+        for i, (frame, origin) in enumerate(zip(walk_frames, anchors[direction]["walk"])):
+            strip.paste(layer(frame, overlay, origin, sizes["walk"]), (i * width, 0))
+
+        VARIANTS.save(strip, out_dir / f"{accessory_id}_{direction}_walk.png")
+        VARIANTS.save(layer(idle, overlay, anchors[direction]["idle"], sizes["idle"]),
+                      out_dir / f"{accessory_id}_{direction}.png")
+    print(f"  ✅ {species} + {accessory_id}")
+
+
+def check(species, accessory_id):
+    """Compare a baked combination with the client's runtime layering.
+
+    Returns True if identical, False if pixels differ, None if the check
+    couldn't run (no node or no `canvas` package).
+    """
+    try:
+        result = subprocess.run(["node", str(CHECK_SCRIPT), species, accessory_id],
+                                capture_output=True, text=True)
+    except FileNotFoundError:
+        print("  ⚠️  node not found")
+        return None
+    for line in (result.stdout + result.stderr).strip().splitlines():
+        print(f"  {line}")
+    if result.returncode not in (0, 1):
+        return None
+    return result.returncode == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake species x accessory composite sheets.")
+    parser.add_argument("--species", action="append", choices=list(characters.CHARACTER_TYPES),
+                        help="species to bake (repeatable; default: all when --accessory is given)")
+    parser.add_argument("--accessory", action="append", choices=list(ACCESSORY_SLOTS),
+                        help="accessory to bake (repeatable; default: all when --species is given)")
+    parser.add_argument("--all", action="store_true", help="bake every species x accessory combination")
+    parser.add_argument("--check", action="store_true",
+                        help="compare the first baked combination with the client's runtime layering")
+    add_scales_argument(parser, "composites")
+    args = parser.parse_args()
+    VARIANTS.scales = args.scales
+
+    print("🎩 Baking Claw World accessory composites...")
+    print(f"Characters: {characters.OUTPUT_DIR}")
+    print(f"Accessories: {accessories.OUTPUT_DIR}")
+    print()
+
+    # Anchors for every species/direction/frame
+    frames = {}
+    anchor_table = {}
+    for species in characters.CHARACTER_TYPES:
+        frames_by_dir = load_species_frames(species)
+        if not frames_by_dir:
+            print(f"  ⚠️  No processed frames for {species}")
+            continue
+        frames[species] = frames_by_dir
+        anchor_table[species] = {
+            direction: measure_anchors(idle, walk_frames)
+            for direction, (idle, walk_frames) in frames_by_dir.items()
+        }
+
+    overlays = {}
+    accessory_table = {}
+    for accessory_id, slot in ACCESSORY_SLOTS.items():
+        path = accessories.OUTPUT_DIR / f"{accessory_id}.png"
+        if not path.exists():
+            print(f"  ⚠️  Missing accessory: {accessory_id}.png")
+            continue
+        with Image.open(path) as img:
+            overlay = img.convert('RGBA')
+        overlays[accessory_id] = overlay
+        # Idle draws the overlay at its own size, walk frames stretch it over the frame
+        accessory_table[accessory_id] = {
+            "slot": slot,
+            "sizes": {"idle": list(overlay.size), "walk": list(FRAME_SIZE)}
+        }
+
+    table = {
+        "frame_size": list(FRAME_SIZE),
+        "accessories": accessory_table,
+        "species": anchor_table
+    }
+    write_bytes_atomic(ANCHORS_PATH, (json.dumps(table, indent=2) + "\n").encode('utf-8'))
+    print(f"  📍 Anchors saved to {ANCHORS_PATH}")
+
+    # Composite sheets
+    if args.all:
+        combos = itertools.product(characters.CHARACTER_TYPES, ACCESSORY_SLOTS)
+    elif args.species or args.accessory:
+        combos = itertools.product(args.species or list(characters.CHARACTER_TYPES),
+                                   args.accessory or list(ACCESSORY_SLOTS))
+    else:
+        combos = POPULAR_COMBINATIONS
+
+    baked = []
+    for species, accessory_id in combos:
+        if species not in frames or accessory_id not in overlays:
+            continue
+        bake(species, accessory_id, frames[species], anchor_table[species],
+             overlays[accessory_id], accessory_table[accessory_id]["sizes"])
+        baked.append((species, accessory_id))
+    VARIANTS.write_manifest()
+
+    if args.check and baked:
+        print()
+        matches = check(*baked[0])
+        if matches is None:
+            print("❌ Could not compare against runtime layering")
+            sys.exit(1)
+        if not matches:
+            print("❌ Baked composites differ from runtime layering")
+            sys.exit(1)
+
+    print()
+    print(f"✅ Done! ({summary()})")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@
 from PIL import Image
 from pathlib import Path
 
+from asset_writer import save_atomic
+
 CHAR_DIR = Path(__file__).parent.parent / "client/assets/sprites/characters/hermit_crab"
 
 def flip_and_save():
@@ -14,7 +16,7 @@ def flip_and_save():
     if west_walk.exists() and not east_walk.exists():
         img = Image.open(west_walk)
         flipped = img.transpose(Image.FLIP_LEFT_RIGHT)
-        flipped.save(east_walk)
+        save_atomic(flipped, east_walk)
         print(f"✅ Created east_walk.png from flipped west_walk.png")
     
     # Flip the static sprite
@@ -24,7 +26,7 @@ def flip_and_save():
     if west.exists() and not east.exists():
         img = Image.open(west)
         flipped = img.transpose(Image.FLIP_LEFT_RIGHT)
-        flipped.save(east)
+        save_atomic(flipped, east)
         print(f"✅ Created east.png from flipped west.png")
     
     # Flip individual frames
@@ -36,7 +38,7 @@ def flip_and_save():
         if west_frame.exists() and not east_frame.exists():
             img = Image.open(west_frame)
             flipped = img.transpose(Image.FLIP_LEFT_RIGHT)
-            flipped.save(east_frame)
+            save_atomic(flipped, east_frame)
             print(f"✅ Created east_walk_{i}.png from flipped west_walk_{i}.png")
 
 if __name__ == "__main__":
@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+Load generator and latency benchmark for the Claw World multiplayer servers.
+
+Starts server/multiplayerServer.js (or server/gameServer.js) locally, ramps up
+simulated clients that speak the same join/move/say/ping messages as the game
+and bot scripts, and records:
+
+- tick-rate stability: inter-arrival times of periodic server broadcasts
+- round trips: ping -> pong, say -> own chat echo, command -> result
+- bytes sent/received per client
+- server CPU and RSS over time (from /proc, Linux only)
+
+Writes a JSON report (--report) and prints a summary. Use --url to target an
+already running server instead (pass --pid to still sample its CPU/RSS).
+
+Requires: pip install websockets
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+ROOT = Path(__file__).parent.parent
+REPORT_PATH = ROOT / "loadtest-report.json"
+
+SERVERS = {
+    "multiplayer": {"script": "server/multiplayerServer.js", "port_env": "PORT", "port": 3003},
+    "game": {"script": "server/gameServer.js", "port_env": "GAME_PORT", "port": 3002}
+}
+
+SPECIES = ["lobster", "crab", "shrimp", "mantis_shrimp", "hermit_crab"]
+COLORS = ["red", "orange", "yellow", "green", "teal", "blue", "purple", "pink"]
+STEPS = {"north": (0, -16), "south": (0, 16), "east": (16, 0), "west": (-16, 0)}
+
+# Periodic server broadcasts used to judge tick stability (EnemyManager ticks,
+# railwayServer's batched { t: 'p' } positions)
+TICK_MARKERS = ('"type":"enemy_move"', '"t":"p"')
+DEFAULT_TICK_MS = 400
+
+SAMPLE_INTERVAL = 1.0
+PROGRESS_INTERVAL = 5.0
+PERCENTILES = (50, 90, 99)
+
+
+def percentiles(values, points=PERCENTILES):
+    """{"p50": ..., ...} in milliseconds-ready floats (empty -> None)."""
+    if not values:
+        return {f"p{p}": None for p in points}
+    ordered = sorted(values)
+    return {f"p{p}": ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))] for p in points}
+
+
+def wire_length(message):
+    """Payload bytes of a WebSocket message (len() of a str counts characters)."""
+    if isinstance(message, bytes):
+        return len(message)
+    return len(message) if message.isascii() else len(message.encode('utf-8'))
+
+
+class ServerProcess:
+    """A locally started node server."""
+
+    def __init__(self, kind, port, log_path=None):
+        config = SERVERS[kind]
+        env = dict(os.environ, **{config["port_env"]: str(port)})
+        self.log = open(log_path, 'w') if log_path else subprocess.DEVNULL
+        self.process = subprocess.Popen(
+            ["node", config["script"]], cwd=ROOT, env=env,
+            stdout=self.log, stderr=subprocess.STDOUT
+        )
+        self.pid = self.process.pid
+
+    def wait_ready(self, port, timeout=30):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"server exited with code {self.process.returncode}")
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+                return
+            except OSError:
+                time.sleep(0.2)
+        raise RuntimeError(f"server did not listen on port {port} within {timeout}s")
+
+    def stop(self):
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+        if self.log is not subprocess.DEVNULL:
+            self.log.close()
+
+
+class ResourceSampler:
+    """Samples a process's CPU% and RSS from /proc once per interval."""
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.ticks_per_second = os.sysconf('SC_CLK_TCK')
+        self.page_size = os.sysconf('SC_PAGE_SIZE')
+        self.last = None
+
+    def sample(self):
+        """(cpu_percent, rss_mb), or None if the process can't be read."""
+        try:
+            with open(f"/proc/{self.pid}/stat") as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+            with open(f"/proc/{self.pid}/statm") as f:
+                rss_pages = int(f.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            return None
+        cpu_seconds = (int(fields[11]) + int(fields[12])) / self.ticks_per_second
+        now = time.monotonic()
+        cpu_percent = None
+        if self.last:
+            cpu_percent = 100 * (cpu_seconds - self.last[1]) / max(1e-6, now - self.last[0])
+        self.last = (now, cpu_seconds)
+        return cpu_percent, rss_pages * self.page_size / (1024 * 1024)
+
+
+class SimClient:
+    """One simulated player."""
+
+    def __init__(self, index, args, observer):
+        self.index = index
+        self.args = args
+        self.observer = observer
+        self.name = f"Load-{index}"
+        self.x = 456 + random.randint(-20, 20) * 16
+        self.y = 1000 + random.randint(-20, 20) * 16
+
+        self.connected = False
+        self.failed = None
+        self.disconnected = False
+        self.join_ms = None
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.messages_received = 0
+        self.ping_rtts = []
+        self.chat_rtts = []
+        self.command_rtts = []
+        self.tick_times = []
+
+        self._pings = deque()
+        self._commands = deque()
+        self._chats = {}
+        self._chat_seq = 0
+        self._chat_marker = f'"text":"load {index}:'
+        self._joined = asyncio.Event()
+
+    async def send(self, ws, message):
+        data = json.dumps(message, separators=(',', ':'))
+        self.bytes_sent += wire_length(data)
+        await ws.send(data)
+
+    def on_message(self, message):
+        now = time.perf_counter()
+        self.bytes_received += wire_length(message)
+        self.messages_received += 1
+        if isinstance(message, bytes):
+            message = message.decode('utf-8', 'replace')
+
+        if '"type":"pong"' in message:
+            if self._pings:
+                self.ping_rtts.append((now - self._pings.popleft()) * 1000)
+        elif self._chat_marker in message:
+            seq = int(json.loads(message)["text"].split(':')[1])
+            sent = self._chats.pop(seq, None)
+            if sent is not None:
+                self.chat_rtts.append((now - sent) * 1000)
+        elif '"type":"result"' in message or ('"command"' in message and '"type":"error"' in message):
+            if self._commands:
+                self.command_rtts.append((now - self._commands.popleft()) * 1000)
+        elif '"type":"joined"' in message or '"type":"character_created"' in message:
+            self._joined.set()
+        elif self.observer and any(marker in message for marker in TICK_MARKERS):
+            self.tick_times.append(now)
+
+    async def receive(self, ws):
+        try:
+            async for message in ws:
+                self.on_message(message)
+        except websockets.ConnectionClosed:
+            pass
+        self.disconnected = True
+
+    async def join(self, ws):
+        started = time.perf_counter()
+        if self.args.server == "game":
+            await self.send(ws, {"type": "create_character", "name": self.name,
+                                 "species": SPECIES[self.index % len(SPECIES)],
+                                 "color": COLORS[self.index % len(COLORS)]})
+        else:
+            await self.send(ws, {"type": "join", "name": self.name,
+                                 "species": SPECIES[self.index % len(SPECIES)],
+                                 "color": COLORS[self.index % len(COLORS)],
+                                 "x": self.x, "y": self.y})
+        await asyncio.wait_for(self._joined.wait(), self.args.join_timeout)
+        self.join_ms = (time.perf_counter() - started) * 1000
+
+    async def move(self, ws):
+        direction = random.choice(list(STEPS))
+        if self.args.server == "game":
+            self._commands.append(time.perf_counter())
+            await self.send(ws, {"type": "command", "command": f"walk {direction}"})
+            return
+        dx, dy = STEPS[direction]
+        self.x += dx
+        self.y += dy
+        await self.send(ws, {"type": "move", "x": self.x, "y": self.y, "direction": direction, "isMoving": True})
+
+    async def chat(self, ws):
+        self._chat_seq += 1
+        self._chats[self._chat_seq] = time.perf_counter()
+        text = f"load {self.index}:{self._chat_seq}"
+        if self.args.server == "game":
+            self._commands.append(time.perf_counter())
+            await self.send(ws, {"type": "command", "command": f"say {text}"})
+        else:
+            await self.send(ws, {"type": "say", "text": text})
+
+    async def ping(self, ws):
+        self._pings.append(time.perf_counter())
+        await self.send(ws, {"type": "ping"})
+
+    async def run(self, url, stop):
+        try:
+            async with websockets.connect(url, max_size=None, ping_interval=None,
+                                          open_timeout=self.args.join_timeout, compression=None) as ws:
+                receiver = asyncio.create_task(self.receive(ws))
+                await self.join(ws)
+                self.connected = True
+
+                # Random phase so clients don't send in lockstep
+                actions = [(self.args.move_interval, self.move),
+                           (self.args.chat_interval, self.chat),
+                           (self.args.ping_interval, self.ping)]
+                now = time.monotonic()
+                due = [now + random.uniform(0, interval) for interval, _ in actions]
+                while not stop.is_set() and not self.disconnected:
+                    i = min(range(len(due)), key=due.__getitem__)
+                    try:
+                        await asyncio.wait_for(stop.wait(), max(0.0, due[i] - time.monotonic()))
+                        break
+                    except asyncio.TimeoutError:
+                        pass
+                    interval, action = actions[i]
+                    await action(ws)
+                    due[i] += interval
+                receiver.cancel()
+        except (OSError, asyncio.TimeoutError, websockets.WebSocketException) as e:
+            if not self.connected:
+                self.failed = f"{type(e).__name__}: {e}"
+            else:
+                self.disconnected = True
+
+
+def tick_stats(clients, expected_ms):
+    """Inter-arrival statistics for periodic broadcasts seen by observers."""
+    intervals = []
+    for client in clients:
+        times = client.tick_times
+        intervals += [(b - a) * 1000 for a, b in zip(times, times[1:])]
+    if not intervals:
+        return {"samples": 0}
+    mean = statistics.fmean(intervals)
+    return {
+        "samples": len(intervals),
+        "expected_ms": expected_ms,
+        "mean_ms": mean,
+        "rate_hz": 1000 / mean if mean else None,
+        "stdev_ms": statistics.pstdev(intervals),
+        **{f"{k}_ms": v for k, v in percentiles(intervals).items()},
+        "max_ms": max(intervals),
+        "late_ratio": sum(i > expected_ms * 1.5 for i in intervals) / len(intervals)
+    }
+
+
+def summarize(values):
+    return {"count": len(values), **{f"{k}_ms": v for k, v in percentiles(values).items()},
+            "max_ms": max(values) if values else None}
+
+
+async def run_load(args, url, pid):
+    clients = [SimClient(i, args, observer=i < args.observers) for i in range(args.clients)]
+    stop = asyncio.Event()
+    sampler = ResourceSampler(pid) if pid and os.path.exists(f"/proc/{pid}") else None
+    timeline = []
+    started = time.monotonic()
+    tasks = []
+
+    async def sample_loop():
+        last_received = last_sent = 0
+        while not stop.is_set():
+            usage = sampler.sample() if sampler else None
+            received = sum(c.bytes_received for c in clients)
+            sent = sum(c.bytes_sent for c in clients)
+            timeline.append({
+                "t": round(time.monotonic() - started, 2),
+                "connected": sum(c.connected and not c.disconnected for c in clients),
+                "server_cpu_percent": usage[0] if usage else None,
+                "server_rss_mb": usage[1] if usage else None,
+                "received_bytes_per_s": (received - last_received) / SAMPLE_INTERVAL,
+                "sent_bytes_per_s": (sent - last_sent) / SAMPLE_INTERVAL
+            })
+            last_received, last_sent = received, sent
+            try:
+                await asyncio.wait_for(stop.wait(), SAMPLE_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+    sampling = asyncio.create_task(sample_loop())
+
+    # Ramp up, then hold for --duration
+    delay = args.ramp / args.clients if args.clients else 0
+    for client in clients:
+        tasks.append(asyncio.create_task(client.run(url, stop)))
+        if delay:
+            await asyncio.sleep(delay)
+    print(f"  🚀 {args.clients} clients started in {time.monotonic() - started:.1f}s")
+
+    hold_ends = time.monotonic() + args.duration
+    while time.monotonic() < hold_ends:
+        # Never sleep past the deadline, or the rates are computed over a longer run
+        await asyncio.sleep(min(PROGRESS_INTERVAL, max(0.0, hold_ends - time.monotonic())))
+        latest = timeline[-1] if timeline else {}
+        cpu = latest.get("server_cpu_percent")
+        print(f"  ⏱️  {time.monotonic() - started:5.0f}s  connected={latest.get('connected', 0)}"
+              + (f"  cpu={cpu:.0f}%  rss={latest['server_rss_mb']:.0f}MB" if cpu is not None else ""))
+
+    stop.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await sampling
+    return clients, timeline, time.monotonic() - started
+
+
+def build_report(args, clients, timeline, elapsed, generator_cpu):
+    connected = [c for c in clients if c.join_ms is not None]
+    failures = {}
+    for c in clients:
+        if c.failed:
+            failures[c.failed] = failures.get(c.failed, 0) + 1
+
+    cpu = [s["server_cpu_percent"] for s in timeline if s["server_cpu_percent"] is not None]
+    rss = [s["server_rss_mb"] for s in timeline if s["server_rss_mb"] is not None]
+    return {
+        "config": {k: v for k, v in vars(args).items() if k not in ("report", "server_log")},
+        "elapsed_s": elapsed,
+        "clients": {
+            "target": len(clients),
+            "connected": len(connected),
+            "failed": sum(c.failed is not None for c in clients),
+            "disconnected_early": sum(c.connected and c.disconnected for c in clients),
+            "failures": failures
+        },
+        "join": summarize([c.join_ms for c in connected]),
+        "ping_rtt": summarize([r for c in clients for r in c.ping_rtts]),
+        "chat_rtt": summarize([r for c in clients for r in c.chat_rtts]),
+        "command_rtt": summarize([r for c in clients for r in c.command_rtts]),
+        "tick": tick_stats([c for c in clients if c.observer], args.tick_ms),
+        "bytes_per_client": {
+            "sent_mean": statistics.fmean([c.bytes_sent for c in connected]) if connected else 0,
+            "received_mean": statistics.fmean([c.bytes_received for c in connected]) if connected else 0,
+            "received_p99": percentiles([c.bytes_received for c in connected])["p99"],
+            "received_per_s_mean": (statistics.fmean([c.bytes_received for c in connected]) / elapsed
+                                    if connected and elapsed else 0),
+            "messages_received_mean": statistics.fmean([c.messages_received for c in connected]) if connected else 0
+        },
+        "server": {
+            "cpu_percent_mean": statistics.fmean(cpu) if cpu else None,
+            "cpu_percent_max": max(cpu) if cpu else None,
+            "rss_mb_start": rss[0] if rss else None,
+            "rss_mb_max": max(rss) if rss else None,
+            "rss_mb_end": rss[-1] if rss else None
+        },
+        "generator_cpu_percent": 100 * generator_cpu / elapsed if elapsed else None,
+        "timeline": timeline
+    }
+
+
+def fmt(value, unit="ms"):
+    return "—" if value is None else f"{value:.1f}{unit}"
+
+
+def print_summary(report):
+    c = report["clients"]
+    print()
+    print("📊 Load test results")
+    print(f"   Clients: {c['connected']}/{c['target']} connected, {c['failed']} failed, "
+          f"{c['disconnected_early']} dropped")
+    for reason, count in sorted(c["failures"].items(), key=lambda kv: -kv[1])[:3]:
+        print(f"      {count}× {reason}")
+    for key, label in (("join", "Join"), ("ping_rtt", "Ping RTT"), ("chat_rtt", "Chat RTT"),
+                       ("command_rtt", "Command RTT")):
+        stats = report[key]
+        if stats["count"]:
+            print(f"   {label:<12} p50 {fmt(stats['p50_ms'])}  p90 {fmt(stats['p90_ms'])}  "
+                  f"p99 {fmt(stats['p99_ms'])}  max {fmt(stats['max_ms'])}  (n={stats['count']})")
+    tick = report["tick"]
+    if tick["samples"]:
+        print(f"   Tick         {fmt(tick['rate_hz'], ' Hz')} (expected {1000 / tick['expected_ms']:.1f} Hz)  "
+              f"stdev {fmt(tick['stdev_ms'])}  p99 {fmt(tick['p99_ms'])}  late {tick['late_ratio']:.1%}")
+    b = report["bytes_per_client"]
+    print(f"   Per client   sent {b['sent_mean'] / 1024:.1f} KB, received {b['received_mean'] / 1024:.1f} KB "
+          f"({b['received_per_s_mean'] / 1024:.1f} KB/s, {b['messages_received_mean']:.0f} msgs)")
+    s = report["server"]
+    if s["cpu_percent_mean"] is not None:
+        print(f"   Server       CPU mean {fmt(s['cpu_percent_mean'], '%')} max {fmt(s['cpu_percent_max'], '%')}  "
+              f"RSS {fmt(s['rss_mb_start'], 'MB')} → max {fmt(s['rss_mb_max'], 'MB')}")
+    print(f"   Generator    CPU {fmt(report['generator_cpu_percent'], '%')}"
+          + ("  ⚠️ load generator saturated; results understate the server" if
+             (report['generator_cpu_percent'] or 0) > 90 else ""))
+
+
+def raise_fd_limit(needed):
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < needed:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(hard, max(needed, soft)), hard))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the Claw World multiplayer server.")
+    parser.add_argument("--server", choices=list(SERVERS), default="multiplayer",
+                        help="server script to start, and the protocol to speak")
+    parser.add_argument("--url", help="target a running server instead of starting one (ws://host:port)")
+    parser.add_argument("--pid", type=int, help="with --url: server process to sample CPU/RSS from")
+    parser.add_argument("--port", type=int, help="port for the started server (default: the server's own)")
+    parser.add_argument("--clients", type=int, default=500, help="simulated clients (default: 500)")
+    parser.add_argument("--ramp", type=float, default=10, help="seconds to connect all clients (default: 10)")
+    parser.add_argument("--duration", type=float, default=30, help="seconds to hold full load (default: 30)")
+    parser.add_argument("--move-interval", type=float, default=0.5, help="seconds between moves (default: 0.5)")
+    parser.add_argument("--chat-interval", type=float, default=10, help="seconds between chats (default: 10)")
+    parser.add_argument("--ping-interval", type=float, default=2, help="seconds between pings (default: 2)")
+    parser.add_argument("--join-timeout", type=float, default=30, help="seconds to wait for join (default: 30)")
+    parser.add_argument("--observers", type=int, default=20, help="clients that record tick timing (default: 20)")
+    parser.add_argument("--tick-ms", type=float, default=DEFAULT_TICK_MS,
+                        help=f"expected broadcast interval (default: {DEFAULT_TICK_MS}, EnemyManager)")
+    parser.add_argument("--server-log", type=Path, help="write the started server's output here")
+    parser.add_argument("--report", type=Path, default=REPORT_PATH, help=f"JSON report (default: {REPORT_PATH.name})")
+    args = parser.parse_args()
+
+    if websockets is None:
+        print("❌ websockets is not installed: pip install websockets")
+        sys.exit(1)
+
+    raise_fd_limit(args.clients + 256)
+
+    server = None
+    pid = args.pid
+    url = args.url
+    if not url:
+        port = args.port or SERVERS[args.server]["port"]
+        print(f"🖥️  Starting {SERVERS[args.server]['script']} on port {port}...")
+        server = ServerProcess(args.server, port, args.server_log)
+        pid = server.pid
+        url = f"ws://127.0.0.1:{port}"
+
+    print(f"🦀 Load testing {url} with {args.clients} clients "
+          f"(ramp {args.ramp:.0f}s, hold {args.duration:.0f}s)")
+    try:
+        if server:
+            server.wait_ready(port)
+        cpu_before = time.process_time()
+        clients, timeline, elapsed = asyncio.run(run_load(args, url, pid))
+        generator_cpu = time.process_time() - cpu_before
+    finally:
+        if server:
+            server.stop()
+
+    report = build_report(args, clients, timeline, elapsed, generator_cpu)
+    args.report.write_text(json.dumps(report, indent=2, default=str) + "\n")
+    print_summary(report)
+    print()
+    print(f"💾 Report saved to {args.report}")
+
+
+if __name__ == "__main__":
+    main()
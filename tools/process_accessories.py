@@ -2,12 +2,18 @@
 """
 Process accessory sprites for Claw World.
 Converts 1024x1024 accessory images to game-ready 16x16 overlays.
+Run with --watch to rebuild individual accessories as their sources change.
 """
 
+import argparse
 from pathlib import Path
 from PIL import Image
 import numpy as np
 
+from asset_watch import watch
+from asset_writer import summary
+from scaled_variants import ScaledVariants, add_scales_argument
+
 SOURCE_DIR = Path(__file__).parent.parent / "output/imagegen/accessories"
 OUTPUT_DIR = Path(__file__).parent.parent / "client/assets/sprites/accessories"
 
@@ -25,6 +31,9 @@ ACCESSORIES = {
     "bandana_pirate.png": "pirate_bandana"
 }
 
+# Writes overlays plus any @Nx variants enabled for this category (--scales)
+VARIANTS = ScaledVariants("accessories")
+
 
 def find_content_bounds(img):
     """Find the bounding box of non-transparent pixels."""
@@ -70,11 +79,31 @@ def process_accessory(src_path, output_id):
     
     # Save
     output_path = OUTPUT_DIR / f"{output_id}.png"
-    output.save(output_path)
+    VARIANTS.save(output, output_path)
     print(f"  ✅ {output_id}.png ({new_width}x{new_height})")
 
 
+def rebuild_changed(paths):
+    """Reprocess only the accessories whose source images changed."""
+    for src_path in sorted(paths):
+        output_id = ACCESSORIES.get(src_path.name)
+        if output_id is None:
+            continue
+        if src_path.exists():
+            process_accessory(src_path, output_id)
+        else:
+            print(f"  ⚠️  Missing: {src_path.name}")
+    VARIANTS.write_manifest()
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Process Claw World accessory sprites.")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and rebuild accessories as their sources change")
+    add_scales_argument(parser, "accessories")
+    args = parser.parse_args()
+    VARIANTS.scales = args.scales
+
     print("🎩 Processing Claw World accessories...")
     print(f"Source: {SOURCE_DIR}")
     print(f"Output: {OUTPUT_DIR}")
@@ -89,9 +118,14 @@ def main():
             process_accessory(src_path, output_id)
         else:
             print(f"  ⚠️  Missing: {src_name}")
+    VARIANTS.write_manifest()
     
     print()
-    print("✅ Done!")
+    print(f"✅ Done! ({summary()})")
+
+    if args.watch:
+        print("\n👀 Watching for source changes (Ctrl+C to stop)")
+        watch([SOURCE_DIR], rebuild_changed)
 
 
 if __name__ == "__main__":
@@ -6,13 +6,24 @@ Reads 1024x1024 3-frame sprite sheets and converts them to game-ready sprites:
 - Splits into 3 individual frames
 - Downscales to game size (16x24)
 - Creates folder structure for each character type
+
+Frames are composited with NumPy: nearest-neighbour scaling is a gather
+through precomputed index arrays that writes straight into one
+preallocated per-species sheet, and east is a mirrored view of west.
+
+Run with --watch to rebuild only the species whose source sheets change.
 """
 
-import os
+import argparse
+import functools
 from pathlib import Path
 from PIL import Image
 import numpy as np
 
+from asset_watch import watch
+from asset_writer import summary
+from scaled_variants import ScaledVariants, add_scales_argument
+
 # Configuration
 SOURCE_DIR = Path(__file__).parent.parent / "output/imagegen/crustaceans"
 OUTPUT_DIR = Path(__file__).parent.parent / "client/assets/sprites/characters"
@@ -39,11 +50,19 @@ SYNC_ROOT_FROM = "lobster"
 # Mirror east from west for consistent facing (Pokémon-style)
 FORCE_MIRROR_EAST_FROM_WEST = True
 
+FRAMES_PER_DIRECTION = 3
+
+# Writes sprites plus any @Nx variants enabled for this category (--scales)
+VARIANTS = ScaledVariants("characters")
+
 
 def find_content_bounds(img, alpha_threshold=64):
-    """Find the bounding box of visible pixels, ignoring faint alpha noise."""
-    arr = np.array(img)
-    if arr.shape[2] == 4:  # Has alpha channel
+    """Find the bounding box of visible pixels, ignoring faint alpha noise.
+
+    Accepts a PIL image or an (H, W, C) array.
+    """
+    arr = np.asarray(img)
+    if arr.ndim == 3 and arr.shape[2] == 4:  # Has alpha channel
         alpha = arr[:, :, 3]
         rows = np.any(alpha >= alpha_threshold, axis=1)
         cols = np.any(alpha >= alpha_threshold, axis=0)
@@ -51,23 +70,19 @@ def find_content_bounds(img, alpha_threshold=64):
             return None
         ymin, ymax = np.where(rows)[0][[0, -1]]
         xmin, xmax = np.where(cols)[0][[0, -1]]
-        return (xmin, ymin, xmax + 1, ymax + 1)
-    return (0, 0, img.width, img.height)
+        return (int(xmin), int(ymin), int(xmax) + 1, int(ymax) + 1)
+    return (0, 0, arr.shape[1], arr.shape[0])
 
 
-def split_into_frames(img, num_frames=3):
-    """Split a sprite sheet into individual frames using equal-width slices."""
-    if img.width < num_frames:
+def split_into_frames(sheet, num_frames=FRAMES_PER_DIRECTION):
+    """Split an (H, W, 4) sheet into equal-width frame views (no copies)."""
+    width = sheet.shape[1]
+    if width < num_frames:
         print("  Warning: Image too small to split")
         return []
 
-    frame_width = img.width // num_frames
-    frames = []
-    for i in range(num_frames):
-        x0 = i * frame_width
-        x1 = x0 + frame_width
-        frames.append(img.crop((x0, 0, x1, img.height)))
-    return frames
+    frame_width = width // num_frames
+    return [sheet[:, i * frame_width:(i + 1) * frame_width] for i in range(num_frames)]
 
 
 def percentile(values, q):
@@ -85,25 +100,46 @@ def percentile(values, q):
     return values[lo] * (hi - idx) + values[hi] * (idx - lo)
 
 
-def resize_frame(frame, scale, target_width=TARGET_WIDTH, target_height=TARGET_HEIGHT):
-    """Resize a frame using a global scale factor and bottom-anchor."""
-    if frame.height == 0 or frame.width == 0:
-        return Image.new('RGBA', (target_width, target_height), (0, 0, 0, 0))
+@functools.lru_cache(maxsize=None)
+def nearest_indices(src_len, dst_len):
+    """Source index for each output pixel under PIL's NEAREST resize.
 
-    new_width = max(1, int(round(frame.width * scale)))
-    new_height = max(1, int(round(frame.height * scale)))
-    resized = frame.resize((new_width, new_height), Image.Resampling.NEAREST)
+    Resizing a 1-pixel-high ramp of indices reproduces Pillow's fixed-point
+    sampling exactly, so output stays identical to Image.resize().
+    """
+    ramp = Image.fromarray(np.arange(src_len, dtype=np.int32)[None, :])
+    indices = np.asarray(ramp.resize((dst_len, 1), Image.Resampling.NEAREST))[0].astype(np.intp)
+    indices.setflags(write=False)
+    return indices
 
-    # Crop horizontally if too wide
-    if resized.width > target_width:
-        left = (resized.width - target_width) // 2
-        resized = resized.crop((left, 0, left + target_width, resized.height))
 
-    output = Image.new('RGBA', (target_width, target_height), (0, 0, 0, 0))
-    x = max(0, (target_width - resized.width) // 2)
-    y = target_height - resized.height
-    output.paste(resized, (x, y))
-    return output
+def composite_frame(frame, bounds, scale, out):
+    """Scale the bounded content of frame into out, bottom-anchored and centred.
+
+    out is a zeroed (TARGET_HEIGHT, TARGET_WIDTH, 4) view into the sheet
+    buffer; only the visible output pixels are gathered from the source.
+    """
+    xmin, ymin, xmax, ymax = bounds
+    width, height = xmax - xmin, ymax - ymin
+    if width == 0 or height == 0:
+        return
+
+    target_height, target_width = out.shape[:2]
+    new_width = max(1, int(round(width * scale)))
+    new_height = max(1, int(round(height * scale)))
+    xs = nearest_indices(width, new_width) + xmin
+    ys = nearest_indices(height, new_height) + ymin
+
+    # Crop horizontally (centred) if too wide, clip the top if too tall
+    if new_width > target_width:
+        left = (new_width - target_width) // 2
+        xs = xs[left:left + target_width]
+    if new_height > target_height:
+        ys = ys[new_height - target_height:]
+
+    x = (target_width - len(xs)) // 2
+    y = target_height - len(ys)
+    out[y:, x:x + len(xs)] = frame[ys[:, None], xs[None, :]]
 
 
 def process_character(char_type, prefix):
@@ -131,17 +167,18 @@ def process_character(char_type, prefix):
             print(f"  ⚠️  Missing: {filename}")
             continue
 
-        img = Image.open(src_path).convert('RGBA')
-        frames = split_into_frames(img)
-        if len(frames) < 3:
-            print(f"    ⚠️  Expected 3 frames, got {len(frames)}")
+        with Image.open(src_path) as img:
+            sheet = np.asarray(img.convert('RGBA'))
+        frames = split_into_frames(sheet)
+        if len(frames) < FRAMES_PER_DIRECTION:
+            print(f"    ⚠️  Expected {FRAMES_PER_DIRECTION} frames, got {len(frames)}")
             continue
 
         frame_bounds = []
         for frame in frames:
             bounds = find_content_bounds(frame)
             if bounds is None:
-                bounds = (0, 0, frame.width, frame.height)
+                bounds = (0, 0, frame.shape[1], frame.shape[0])
             xmin, ymin, xmax, ymax = bounds
             height = ymax - ymin
             width = xmax - xmin
@@ -163,60 +200,97 @@ def process_character(char_type, prefix):
     scale = min(TARGET_HEIGHT / height_ref, TARGET_WIDTH / width_ref)
     print(f"    📏 Scale ref (h={height_ref:.1f}, w={width_ref:.1f}) → scale {scale:.4f}")
 
-    processed_by_dir = {}
+    mirror_east = FORCE_MIRROR_EAST_FROM_WEST and "west" in frames_by_dir
+
+    # One buffer for the whole species: a walk strip per direction
+    sheet = np.zeros((len(DIRECTIONS), TARGET_HEIGHT, TARGET_WIDTH * FRAMES_PER_DIRECTION, 4), np.uint8)
+    strips = dict(zip(DIRECTIONS, sheet))
+
+    def strip_frames(strip):
+        return [strip[:, i * TARGET_WIDTH:(i + 1) * TARGET_WIDTH] for i in range(FRAMES_PER_DIRECTION)]
+
+    def save_direction(direction, strip, frames):
+        for i, frame in enumerate(frames):
+            VARIANTS.save(Image.fromarray(frame), frames_dir / f"{direction}_walk_{i}.png")
+        VARIANTS.save(Image.fromarray(frames[1]), char_dir / f"{direction}.png")
+        VARIANTS.save(Image.fromarray(strip), char_dir / f"{direction}_walk.png")
+
     for direction in DIRECTIONS:
-        if direction not in frames_by_dir:
+        if direction not in frames_by_dir or (mirror_east and direction == "east"):
             continue
 
         print(f"  Processing {direction}...")
-        frames = frames_by_dir[direction]
-        frame_bounds = bounds_by_dir[direction]
+        strip = strips[direction]
+        processed_frames = strip_frames(strip)
+        for frame, bounds, out in zip(frames_by_dir[direction], bounds_by_dir[direction], processed_frames):
+            composite_frame(frame, bounds, scale, out)
 
-        processed_frames = []
-        for i, (frame, bounds) in enumerate(zip(frames, frame_bounds)):
-            xmin, ymin, xmax, ymax = bounds
-            cropped = frame.crop((xmin, ymin, xmax, ymax))
-            resized = resize_frame(cropped, scale)
-            processed_frames.append(resized)
-
-            frame_path = frames_dir / f"{direction}_walk_{i}.png"
-            resized.save(frame_path)
-
-        static_path = char_dir / f"{direction}.png"
-        processed_frames[1].save(static_path)
+        save_direction(direction, strip, processed_frames)
+        print(f"    ✅ Saved {len(processed_frames)} frames + strip")
 
-        strip_width = TARGET_WIDTH * 3
-        strip = Image.new('RGBA', (strip_width, TARGET_HEIGHT), (0, 0, 0, 0))
-        for i, frame in enumerate(processed_frames):
-            strip.paste(frame, (i * TARGET_WIDTH, 0))
+    if mirror_east:
+        mirrored = [frame[:, ::-1] for frame in strip_frames(strips["west"])]
+        strip = strips["east"]
+        for frame, out in zip(mirrored, strip_frames(strip)):
+            out[:] = frame
 
-        strip_path = char_dir / f"{direction}_walk.png"
-        strip.save(strip_path)
+        save_direction("east", strip, mirrored)
+        print("    ✅ Mirrored east from west")
 
-        processed_by_dir[direction] = processed_frames
-        print(f"    ✅ Saved {len(processed_frames)} frames + strip")
 
-    if FORCE_MIRROR_EAST_FROM_WEST and "west" in processed_by_dir:
-        mirrored = [frame.transpose(Image.FLIP_LEFT_RIGHT) for frame in processed_by_dir["west"]]
+def sync_root_sprites():
+    """Copy the default species' sprites and frames to the top level."""
+    source_dir = OUTPUT_DIR / SYNC_ROOT_FROM
+    root_frames = OUTPUT_DIR / "frames"
+    source_frames = source_dir / "frames"
+    root_frames.mkdir(exist_ok=True)
 
-        for i, frame in enumerate(mirrored):
-            frame_path = frames_dir / f"east_walk_{i}.png"
-            frame.save(frame_path)
+    for direction in DIRECTIONS:
+        for suffix in ["", "_walk"]:
+            src = source_dir / f"{direction}{suffix}.png"
+            dst = OUTPUT_DIR / f"{direction}{suffix}.png"
+            if src.exists():
+                VARIANTS.copy(src, dst, link=True)
+
+        for frame in range(3):
+            src_frame = source_frames / f"{direction}_walk_{frame}.png"
+            dst_frame = root_frames / f"{direction}_walk_{frame}.png"
+            if src_frame.exists():
+                VARIANTS.copy(src_frame, dst_frame, link=True)
+    print(f"\n✅ Synced root sprites from '{SYNC_ROOT_FROM}'")
+
+
+def species_for_source(path):
+    """Map a changed source file back to its character type (or None)."""
+    for char_type, prefix in CHARACTER_TYPES.items():
+        for direction in DIRECTIONS:
+            if path.name == f"{prefix}_{direction}_walk.png":
+                return char_type
+    return None
 
-        static_path = char_dir / "east.png"
-        mirrored[1].save(static_path)
 
-        strip_width = TARGET_WIDTH * 3
-        strip = Image.new('RGBA', (strip_width, TARGET_HEIGHT), (0, 0, 0, 0))
-        for i, frame in enumerate(mirrored):
-            strip.paste(frame, (i * TARGET_WIDTH, 0))
+def rebuild_changed(paths):
+    """Reprocess only the species touched by a batch of source changes.
 
-        strip_path = char_dir / "east_walk.png"
-        strip.save(strip_path)
-        print("    ✅ Mirrored east from west")
+    Direction granularity isn't possible here: every direction feeds the
+    species-wide scale, and west also drives the mirrored east sprites.
+    """
+    species = {species_for_source(p) for p in paths} - {None}
+    for char_type in sorted(species):
+        process_character(char_type, CHARACTER_TYPES[char_type])
+    if SYNC_ROOT_FROM in species:
+        sync_root_sprites()
+    VARIANTS.write_manifest()
 
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and rebuild species as their source sheets change")
+    add_scales_argument(parser, "characters")
+    args = parser.parse_args()
+    VARIANTS.scales = args.scales
+
     print("🦀 Claw World Character Sprite Processor")
     print("=" * 50)
     
@@ -238,28 +312,17 @@ def main():
 
     # Sync root-level sprites and frames from default species
     if SYNC_ROOT_FROM in CHARACTER_TYPES:
-        source_dir = OUTPUT_DIR / SYNC_ROOT_FROM
-        root_frames = OUTPUT_DIR / "frames"
-        source_frames = source_dir / "frames"
-        root_frames.mkdir(exist_ok=True)
-
-        for direction in DIRECTIONS:
-            for suffix in ["", "_walk"]:
-                src = source_dir / f"{direction}{suffix}.png"
-                dst = OUTPUT_DIR / f"{direction}{suffix}.png"
-                if src.exists():
-                    Image.open(src).save(dst)
-
-            for frame in range(3):
-                src_frame = source_frames / f"{direction}_walk_{frame}.png"
-                dst_frame = root_frames / f"{direction}_walk_{frame}.png"
-                if src_frame.exists():
-                    Image.open(src_frame).save(dst_frame)
-        print(f"\n✅ Synced root sprites from '{SYNC_ROOT_FROM}'")
+        sync_root_sprites()
+    VARIANTS.write_manifest()
     
     print("\n" + "=" * 50)
     print("✅ Done! Character sprites ready in:")
     print(f"   {OUTPUT_DIR}")
+    print(f"   💾 {summary()}")
+
+    if args.watch:
+        print("\n👀 Watching for source changes (Ctrl+C to stop)")
+        watch([SOURCE_DIR], rebuild_changed)
 
 
 if __name__ == "__main__":
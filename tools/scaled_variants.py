@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Pre-scaled sprite variants for high-DPI rendering.
+
+Next to each 1x sprite the tools can also write nearest-neighbour copies at
+integer multiples (south.png -> south@2x.png, south@4x.png), so the client
+can draw at on-screen size without scaling every frame. That trades memory
+for CPU, so it's opted into per asset category: CATEGORY_SCALES holds the
+defaults and each tool's --scales flag overrides its own category.
+
+Every sprite with variants is listed in client/assets/sprites/scaled_manifest.json:
+    {"scales": {"characters": [2, 4], ...},
+     "sprites": {"characters/lobster/south.png": {"size": [24, 24], "scales": [2, 4]}, ...}}
+Variant paths follow from the base path, so they aren't stored.
+"""
+
+import json
+import os
+from pathlib import Path
+
+from PIL import Image
+
+from asset_writer import copy_atomic, save_atomic, write_bytes_atomic
+
+SPRITES_DIR = Path(__file__).parent.parent / "client/assets/sprites"
+MANIFEST_PATH = SPRITES_DIR / "scaled_manifest.json"
+
+AVAILABLE_SCALES = (2, 3, 4)
+
+# Scales written by default for each asset category (empty = 1x only)
+CATEGORY_SCALES = {
+    "characters": [],
+    "accessories": [],
+    "composites": []
+}
+
+
+def variant_path(path, scale):
+    """south.png -> south@2x.png"""
+    path = Path(path)
+    return path.with_name(f"{path.stem}@{scale}x{path.suffix}")
+
+
+def add_scales_argument(parser, category):
+    """Add the --scales flag for one asset category to a tool's parser."""
+    parser.add_argument("--scales", type=int, nargs="*", choices=AVAILABLE_SCALES,
+                        default=CATEGORY_SCALES[category], metavar="N",
+                        help=f"also write nearest-neighbour @Nx variants of {category} sprites "
+                             f"({'/'.join(map(str, AVAILABLE_SCALES))}; "
+                             f"default: {CATEGORY_SCALES[category] or 'none'})")
+
+
+class ScaledVariants:
+    """Saves sprites of one category plus their scaled variants.
+
+    Call write_manifest() after a batch; variants that are no longer wanted
+    (scale turned off for the category) are deleted at that point.
+    """
+
+    def __init__(self, category, scales=None):
+        self.category = category
+        self.scales = CATEGORY_SCALES[category] if scales is None else scales
+        self.touched = {}
+
+    @property
+    def scales(self):
+        return self._scales
+
+    @scales.setter
+    def scales(self, scales):
+        self._scales = sorted(set(scales))
+
+    def save(self, img, path):
+        """save_atomic the 1x image and each enabled variant."""
+        save_atomic(img, path)
+        for scale in self.scales:
+            scaled = img.resize((img.width * scale, img.height * scale), Image.Resampling.NEAREST)
+            save_atomic(scaled, variant_path(path, scale))
+        self.touched[Path(path)] = img.size
+
+    def copy(self, src, dst, link=False):
+        """copy_atomic a sprite and whichever enabled variants exist for it."""
+        copy_atomic(src, dst, link)
+        for scale in self.scales:
+            if variant_path(src, scale).exists():
+                copy_atomic(variant_path(src, scale), variant_path(dst, scale), link)
+        with Image.open(dst) as img:
+            self.touched[Path(dst)] = img.size
+
+    def write_manifest(self):
+        """Merge this batch into the manifest and drop stale variants."""
+        try:
+            manifest = json.loads(MANIFEST_PATH.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            manifest = {"scales": {}, "sprites": {}}
+
+        sprites = manifest["sprites"]
+        for path, size in self.touched.items():
+            key = path.relative_to(SPRITES_DIR).as_posix()
+            previous = sprites.get(key, {}).get("scales", [])
+            for scale in set(previous) - set(self.scales):
+                stale = variant_path(path, scale)
+                if stale.exists():
+                    os.unlink(stale)
+            if self.scales:
+                sprites[key] = {"size": list(size), "scales": self.scales}
+            else:
+                sprites.pop(key, None)
+        self.touched = {}
+
+        # Forget sprites whose 1x file is gone
+        for key in [k for k in sprites if not (SPRITES_DIR / k).exists()]:
+            del sprites[key]
+        manifest["scales"][self.category] = self.scales
+
+        if not sprites and not MANIFEST_PATH.exists():
+            return
+        manifest["sprites"] = dict(sorted(sprites.items()))
+        manifest["scales"] = dict(sorted(manifest["scales"].items()))
+        write_bytes_atomic(MANIFEST_PATH, (json.dumps(manifest, indent=2) + "\n").encode('utf-8'))